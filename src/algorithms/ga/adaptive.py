@@ -0,0 +1,86 @@
+import math
+from typing import Optional
+
+
+def auto_population_size(n_genes: int, min_pop: int, max_pop: int) -> int:
+    """
+    Ukuran populasi dari ukuran instance: ~ 10 + 8*sqrt(n), dibatasi [min_pop, max_pop].
+    n=5 -> 28, n=50 -> 67, n=500 -> 189.
+    """
+    size = int(round(10 + 8 * math.sqrt(max(1, n_genes))))
+    return max(min_pop, min(max_pop, size))
+
+
+def budget_population_cap(
+    remaining_s: float,
+    remaining_gens: int,
+    sec_per_eval: float,
+    min_pop: int,
+) -> Optional[int]:
+    """
+    Populasi maksimum supaya sisa generasi masih muat di sisa time budget.
+    None kalau belum ada estimasi waktu per evaluasi.
+    """
+    if sec_per_eval <= 0 or remaining_gens <= 0:
+        return None
+    cap = int(remaining_s / (remaining_gens * sec_per_eval))
+    return max(min_pop, cap)
+
+
+class OperatorCredit:
+    """
+    Credit assignment untuk crossover & mutation.
+    Anak dianggap sukses kalau fitness-nya lebih baik dari parent terbaiknya.
+    Success rate tiap operator dihitung dengan decay (jendela kira-kira 1/(1-decay) generasi),
+    lalu rate digeser ke arah target yang proporsional dengan success rate relatif.
+    """
+
+    def __init__(
+        self,
+        crossover_rate: float,
+        mutation_rate: float,
+        min_rate: float,
+        max_rate: float,
+        learning_rate: float,
+        decay: float,
+    ):
+        self.crossover_rate = crossover_rate
+        self.mutation_rate = mutation_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.learning_rate = learning_rate
+        self.decay = decay
+        # [success, trials] per operator
+        self._cx = [0.0, 0.0]
+        self._mut = [0.0, 0.0]
+
+    def credit(self, used_cx: bool, used_mut: bool, improved: bool) -> None:
+        s = 1.0 if improved else 0.0
+        if used_cx:
+            self._cx[0] += s
+            self._cx[1] += 1.0
+        if used_mut:
+            self._mut[0] += s
+            self._mut[1] += 1.0
+
+    @staticmethod
+    def _rate(stat) -> Optional[float]:
+        return stat[0] / stat[1] if stat[1] > 0 else None
+
+    def update(self) -> None:
+        """
+        Panggil sekali per generasi setelah semua anak di-credit.
+        """
+        r_cx = self._rate(self._cx)
+        r_mut = self._rate(self._mut)
+        if r_cx is not None and r_mut is not None and (r_cx + r_mut) > 0:
+            span = self.max_rate - self.min_rate
+            lr = self.learning_rate
+            t_cx = self.min_rate + span * r_cx / (r_cx + r_mut)
+            t_mut = self.min_rate + span * r_mut / (r_cx + r_mut)
+            self.crossover_rate = (1 - lr) * self.crossover_rate + lr * t_cx
+            self.mutation_rate = (1 - lr) * self.mutation_rate + lr * t_mut
+
+        for stat in (self._cx, self._mut):
+            stat[0] *= self.decay
+            stat[1] *= self.decay
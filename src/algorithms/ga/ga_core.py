@@ -1,9 +1,13 @@
 import random
+import time
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from src.model.graph import Graph
 from src.model.objective import evaluate_route
+from src.eval.instrument import Instrument
+from .adaptive import OperatorCredit, auto_population_size, budget_population_cap
+from .population_index import PermutationHasher, PopulationIndex
 
 
 @dataclass
@@ -14,6 +18,24 @@ class GAConfig:
     mutation_rate: float = 0.2
     tournament_k: int = 3
     seed: int = 123
+    # time budget (detik) untuk seluruh run; None = jalan sampai `generations`
+    time_budget_s: Optional[float] = None
+    # adaptive mode: crossover/mutation rate digeser berdasar success rate operator,
+    # population_size diganti ukuran otomatis dari jumlah gen + sisa time budget
+    adaptive: bool = False
+    min_population: int = 20
+    max_population: int = 200
+    min_rate: float = 0.05
+    max_rate: float = 0.95
+    adapt_lr: float = 0.2
+    adapt_decay: float = 0.8
+    # diversity (default off, supaya hasil run_ga lama tidak berubah): anak duplikat
+    # (hash permutation sama) di-mutasi ulang sampai dedup_retries kali;
+    # kalau proporsi individu unik < min_diversity, immigrant_frac individu terburuk diganti acak
+    dedup: bool = False
+    dedup_retries: int = 3
+    min_diversity: float = 0.0
+    immigrant_frac: float = 0.2
 
 
 def _make_individual(rng: random.Random, visit_ids: List[str]) -> List[str]:
@@ -22,13 +44,13 @@ def _make_individual(rng: random.Random, visit_ids: List[str]) -> List[str]:
     return ind
 
 
-def _tournament_select(rng: random.Random, pop: List[List[str]], fitness: List[float], k: int) -> List[str]:
+def _tournament_index(rng: random.Random, fitness: List[float], k: int) -> int:
     best_i = None
     for _ in range(k):
-        i = rng.randrange(len(pop))
+        i = rng.randrange(len(fitness))
         if best_i is None or fitness[i] < fitness[best_i]:
             best_i = i
-    return pop[best_i][:]  # copy
+    return best_i
 
 
 def _order_crossover(rng: random.Random, p1: List[str], p2: List[str]) -> Tuple[List[str], List[str]]:
@@ -67,13 +89,17 @@ def _order_crossover(rng: random.Random, p1: List[str], p2: List[str]) -> Tuple[
     return c1, c2
 
 
-def _swap_mutation(rng: random.Random, ind: List[str]) -> None:
+def _swap_mutation(rng: random.Random, ind: List[str]) -> Tuple[int, int]:
+    """
+    Return posisi yang ditukar (untuk update hash incremental).
+    """
     n = len(ind)
     if n < 2:
-        return
+        return 0, 0
     i = rng.randrange(n)
     j = rng.randrange(n)
     ind[i], ind[j] = ind[j], ind[i]
+    return i, j
 
 
 def run_ga(
@@ -84,53 +110,164 @@ def run_ga(
     start_time_min: int,
     late_penalty: float,
     cfg: GAConfig,
+    inst: Optional[Instrument] = None,
 ) -> Tuple[List[str], float]:
     """
     Return: (best_route_full, best_cost)
     best_route_full = [start] + perm(visit_ids) + [end]
+    inst: kalau diisi, catat evaluations/cache_hits dan waktu operator per generasi.
+    cfg.adaptive: trajectory (crossover/mutation rate, population size) dicatat
+    sebagai record "ga_adapt" di inst dan ikut dicetak di log [GA].
+    Diversity (proporsi individu unik) dicatat per generasi di record "ga_gen".
     """
     rng = random.Random(cfg.seed)
+    timed = inst is not None
+    # jam dinding hanya dibaca kalau ada time budget / adaptive (tanpa itu: nol perf_counter)
+    clocked = cfg.time_budget_s is not None or cfg.adaptive
+    t_run = time.perf_counter() if clocked else 0.0
+
+    cx_rate = cfg.crossover_rate
+    mut_rate = cfg.mutation_rate
+    pop_size = cfg.population_size
+    credit: Optional[OperatorCredit] = None
+    sec_per_ind = 0.0
+    if cfg.adaptive:
+        pop_size = auto_population_size(len(visit_ids), cfg.min_population, cfg.max_population)
+        credit = OperatorCredit(
+            cx_rate, mut_rate, cfg.min_rate, cfg.max_rate, cfg.adapt_lr, cfg.adapt_decay
+        )
 
     # init population (permutation only)
-    pop = [_make_individual(rng, visit_ids) for _ in range(cfg.population_size)]
+    pop = [_make_individual(rng, visit_ids) for _ in range(pop_size)]
+    # hasher punya RNG sendiri, jadi urutan random GA tidak berubah
+    hasher = PermutationHasher(visit_ids, cfg.seed)
+    hashes = [hasher.full(ind) for ind in pop]
 
     def eval_perm(perm: List[str]) -> float:
         route = [start_id] + perm + [end_id]
-        res = evaluate_route(g, route, start_time_min=start_time_min, late_penalty=late_penalty)
+        res = evaluate_route(
+            g, route, start_time_min=start_time_min, late_penalty=late_penalty, keep_schedule=False
+        )
         return res.total_cost
 
-    fitness = [eval_perm(ind) for ind in pop]
+    # cache fitness generasi sebelumnya (key = hash permutation):
+    # elite & anak yang identik dengan parent tidak dievaluasi ulang
+    cache: Dict[int, float] = {}
+
+    def eval_pop(individuals: List[List[str]], keys: List[int], fresh: bool = True) -> List[float]:
+        nonlocal cache
+        out: List[float] = []
+        new_cache: Dict[int, float] = {} if fresh else cache
+        hits = 0
+        for ind, key in zip(individuals, keys):
+            f = cache.get(key)
+            if f is None:
+                f = new_cache.get(key)
+            if f is None:
+                f = eval_perm(ind)
+            else:
+                hits += 1
+            new_cache[key] = f
+            out.append(f)
+        cache = new_cache
+        if inst is not None:
+            inst.count("evaluations", len(individuals) - hits)
+            inst.count("cache_hits", hits)
+        return out
+
+    t_eval = time.perf_counter() if timed else 0.0
+    fitness = eval_pop(pop, hashes)
+    if inst is not None:
+        inst.add_time("ga.evaluate", time.perf_counter() - t_eval)
 
     best_idx = min(range(len(pop)), key=lambda i: fitness[i])
     best_perm = pop[best_idx][:]
+    best_hash = hashes[best_idx]
     best_cost = fitness[best_idx]
 
+    def dedup(ind: List[str], h: int, index: PopulationIndex) -> int:
+        # mutasi ulang anak yang sudah ada di populasi baru
+        tries = 0
+        while h in index and tries < cfg.dedup_retries:
+            i, j = _swap_mutation(rng, ind)
+            h = hasher.after_swap(h, ind, i, j)
+            tries += 1
+        if inst is not None:
+            if tries:
+                inst.count("duplicates_rejected", tries)
+            if h in index:
+                inst.count("duplicates_kept")
+        return h
+
     for gen in range(1, cfg.generations + 1):
+        t_gen = time.perf_counter() if clocked else 0.0
         new_pop: List[List[str]] = []
+        new_hashes: List[int] = []
+        index = PopulationIndex()
+        # (fitness parent terbaik, pakai crossover?, pakai mutation?) per anak, untuk credit
+        origins: List[Tuple[float, bool, bool]] = []
+        t_cx = 0.0
+        t_mut = 0.0
 
         # elitism: keep best
         new_pop.append(best_perm[:])
-
-        while len(new_pop) < cfg.population_size:
-            p1 = _tournament_select(rng, pop, fitness, cfg.tournament_k)
-            p2 = _tournament_select(rng, pop, fitness, cfg.tournament_k)
-
-            if rng.random() < cfg.crossover_rate:
+        new_hashes.append(best_hash)
+        index.add(best_hash)
+
+        while len(new_pop) < pop_size:
+            i1 = _tournament_index(rng, fitness, cfg.tournament_k)
+            i2 = _tournament_index(rng, fitness, cfg.tournament_k)
+            p1 = pop[i1][:]
+            p2 = pop[i2][:]
+
+            if timed:
+                t0 = time.perf_counter()
+            use_cx = rng.random() < cx_rate
+            if use_cx:
                 c1, c2 = _order_crossover(rng, p1, p2)
+                h1, h2 = hasher.full(c1), hasher.full(c2)
             else:
                 c1, c2 = p1[:], p2[:]
-
-            if rng.random() < cfg.mutation_rate:
-                _swap_mutation(rng, c1)
-            if rng.random() < cfg.mutation_rate:
-                _swap_mutation(rng, c2)
-
+                h1, h2 = hashes[i1], hashes[i2]
+            if timed:
+                t1 = time.perf_counter()
+                t_cx += t1 - t0
+
+            mut1 = rng.random() < mut_rate
+            if mut1:
+                i, j = _swap_mutation(rng, c1)
+                h1 = hasher.after_swap(h1, c1, i, j)
+            mut2 = rng.random() < mut_rate
+            if mut2:
+                i, j = _swap_mutation(rng, c2)
+                h2 = hasher.after_swap(h2, c2, i, j)
+            if cfg.dedup:
+                h1 = dedup(c1, h1, index)
+            if timed:
+                t_mut += time.perf_counter() - t1
+
+            parent_best = min(fitness[i1], fitness[i2])
             new_pop.append(c1)
-            if len(new_pop) < cfg.population_size:
+            new_hashes.append(h1)
+            index.add(h1)
+            origins.append((parent_best, use_cx, mut1))
+            if len(new_pop) < pop_size:
+                if cfg.dedup:
+                    h2 = dedup(c2, h2, index)
                 new_pop.append(c2)
+                new_hashes.append(h2)
+                index.add(h2)
+                origins.append((parent_best, use_cx, mut2))
 
         pop = new_pop
-        fitness = [eval_perm(ind) for ind in pop]
+        hashes = new_hashes
+        if timed:
+            t_eval = time.perf_counter()
+        fitness = eval_pop(pop, hashes)
+        if inst is not None:
+            inst.add_time("ga.evaluate", time.perf_counter() - t_eval)
+            inst.add_time("ga.crossover", t_cx)
+            inst.add_time("ga.mutation", t_mut)
 
         # update best
         gen_best_idx = min(range(len(pop)), key=lambda i: fitness[i])
@@ -138,11 +275,65 @@ def run_ga(
         if gen_best_cost < best_cost:
             best_cost = gen_best_cost
             best_perm = pop[gen_best_idx][:]
+            best_hash = hashes[gen_best_idx]
+
+        now = time.perf_counter() if clocked else 0.0
+        out_of_time = cfg.time_budget_s is not None and now - t_run >= cfg.time_budget_s
+
+        if credit is not None:
+            # credit: anak ke-i ada di pop[i + 1] (pop[0] = elite)
+            for (parent_best, used_cx, used_mut), f in zip(origins, fitness[1:]):
+                credit.credit(used_cx, used_mut, f < parent_best)
+            credit.update()
+            cx_rate = credit.crossover_rate
+            mut_rate = credit.mutation_rate
+
+            next_size = auto_population_size(len(visit_ids), cfg.min_population, cfg.max_population)
+            if cfg.time_budget_s is not None:
+                # estimasi detik per individu, dihaluskan (EMA) supaya ukuran populasi tidak lompat-lompat
+                per_ind = (now - t_gen) / len(pop)
+                sec_per_ind = per_ind if sec_per_ind == 0.0 else 0.7 * sec_per_ind + 0.3 * per_ind
+                cap = budget_population_cap(
+                    cfg.time_budget_s - (now - t_run),
+                    cfg.generations - gen,
+                    sec_per_ind,
+                    cfg.min_population,
+                )
+                if cap is not None:
+                    next_size = min(next_size, cap)
+            pop_size = next_size
+
+            if inst is not None:
+                inst.record("ga_adapt", gen=gen, crossover_rate=cx_rate, mutation_rate=mut_rate, population_size=pop_size)
+
+        # diversity collapse -> ganti individu terburuk dengan immigrant acak (elite pop[0] aman)
+        diversity = index.diversity()
+        if diversity < cfg.min_diversity and len(pop) > 1:
+            n_imm = max(1, int(cfg.immigrant_frac * len(pop)))
+            worst = sorted(range(1, len(pop)), key=lambda i: fitness[i], reverse=True)[:n_imm]
+            imm = [_make_individual(rng, visit_ids) for _ in worst]
+            imm_hashes = [hasher.full(ind) for ind in imm]
+            imm_fit = eval_pop(imm, imm_hashes, fresh=False)
+            for i, ind, h, f in zip(worst, imm, imm_hashes, imm_fit):
+                pop[i], hashes[i], fitness[i] = ind, h, f
+                if f < best_cost:
+                    best_cost, best_perm, best_hash = f, ind[:], h
+            if inst is not None:
+                inst.count("immigrants", len(worst))
 
         # log ringkas tiap beberapa gen (biar tidak spam)
-        if gen == 1 or gen % 10 == 0 or gen == cfg.generations:
+        if inst is not None:
+            inst.count("generations")
+            inst.record("ga_gen", gen=gen, best=best_cost, avg=sum(fitness) / len(fitness), diversity=diversity)
+        if gen == 1 or gen % 10 == 0 or gen == cfg.generations or out_of_time:
             avg_cost = sum(fitness) / len(fitness)
-            print(f"[GA] gen {gen:3d} | best {best_cost:8.2f} | avg {avg_cost:8.2f}")
+            line = f"[GA] gen {gen:3d} | best {best_cost:8.2f} | avg {avg_cost:8.2f} | div {diversity:.2f}"
+            if credit is not None:
+                line += f" | cx {cx_rate:.2f} mut {mut_rate:.2f} pop {pop_size}"
+            print(line)
+
+        if out_of_time:
+            break
 
     best_route = [start_id] + best_perm + [end_id]
     return best_route, best_cost
@@ -0,0 +1,64 @@
+import random
+from functools import reduce
+from operator import mul, xor
+from typing import Dict, Iterable, List
+
+MASK64 = (1 << 64) - 1
+
+
+class PermutationHasher:
+    """
+    Hash 64-bit ala Zobrist untuk permutation: XOR dari term(gene, posisi),
+    term = gene_key[gene] * pos_key[posisi] mod 2^64 (pos_key ganjil -> bijektif per posisi).
+    Memori O(n) (bukan tabel n x n), dan swap dua posisi cukup di-update O(1).
+    """
+
+    def __init__(self, genes: Iterable[str], seed: int):
+        rng = random.Random(seed ^ 0x5EED)
+        genes = list(genes)
+        self.gene_key: Dict[str, int] = {g: rng.getrandbits(64) for g in genes}
+        self.pos_key: List[int] = [rng.getrandbits(64) | 1 for _ in range(len(genes))]
+
+    def full(self, perm: List[str]) -> int:
+        if not perm:
+            return 0
+        return reduce(xor, map(mul, map(self.gene_key.__getitem__, perm), self.pos_key)) & MASK64
+
+    def after_swap(self, h: int, perm_after: List[str], i: int, j: int) -> int:
+        """
+        Hash setelah posisi i dan j ditukar (perm_after = permutation SESUDAH swap).
+        """
+        if i == j:
+            return h
+        gk, pk = self.gene_key, self.pos_key
+        a = gk[perm_after[j]]  # gene yang dulu di posisi i
+        b = gk[perm_after[i]]  # gene yang dulu di posisi j
+        delta = (a * pk[i]) ^ (b * pk[j]) ^ (b * pk[i]) ^ (a * pk[j])
+        return (h ^ delta) & MASK64
+
+
+class PopulationIndex:
+    """
+    Multiset hash individu dalam satu populasi: cek duplikat O(1) + ukuran diversity.
+    """
+
+    def __init__(self):
+        self._count: Dict[int, int] = {}
+        self.size = 0
+
+    def add(self, h: int) -> None:
+        self._count[h] = self._count.get(h, 0) + 1
+        self.size += 1
+
+    def __contains__(self, h: int) -> bool:
+        return h in self._count
+
+    @property
+    def unique(self) -> int:
+        return len(self._count)
+
+    def diversity(self) -> float:
+        """
+        Proporsi individu unik (1.0 = tidak ada duplikat).
+        """
+        return self.unique / self.size if self.size else 1.0
@@ -1,3 +1,4 @@
+import time
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 
@@ -7,6 +8,7 @@ from src.model.graph_weighted import WeightedGraph
 from src.algorithms.ga.ga_core import run_ga, GAConfig
 from src.algorithms.physarum.physarum_core import PhysarumModel, PhysarumConfig
 from src.algorithms.physarum.oscillatory_pruning import OscillatoryPruner, PruneConfig
+from src.eval.instrument import Instrument
 
 
 @dataclass
@@ -25,6 +27,7 @@ def run_hybrid_ga_physarum(
     phy_cfg: PhysarumConfig,
     hy_cfg: HybridConfig,
     pr_cfg: Optional[PruneConfig] = None,
+    inst: Optional[Instrument] = None,
 ) -> Tuple[List[str], float]:
     """
     Hybrid loop:
@@ -33,9 +36,12 @@ def run_hybrid_ga_physarum(
       (3) Update Physarum: evaporate + deposit
       (4) Oscillatory pruning (konservatif) untuk memangkas edge lemah
     Return: (best_route_on_base, best_base_cost)
+    inst: kalau diisi, catat waktu GA / update Physarum / pruning per outer iteration.
     """
+    timed = inst is not None
     # Init Physarum on all base edges (directed)
-    edges = list(base_g.travel_min.keys())
+    # lazy matrix: model sparse (hanya edge yang di-deposit), bukan semua N^2 pasangan
+    edges = None if base_g.is_lazy else list(base_g.travel_min.keys())
     phys = PhysarumModel(edges, phy_cfg)
 
     # Init pruner
@@ -47,10 +53,15 @@ def run_hybrid_ga_physarum(
     best_base_cost = float("inf")
 
     for it in range(1, hy_cfg.outer_iters + 1):
+        if timed:
+            t0 = time.perf_counter()
+
         # Weighted graph for GA (pruned edges become very expensive inside WeightedGraph)
         wg = WeightedGraph(base_g, phys)
 
-        # Run GA using weighted travel_time
+        # Run GA using weighted travel_time (record ga_gen diberi tag outer_iter)
+        if inst is not None:
+            inst.tags["outer_iter"] = it
         route_eff, cost_eff = run_ga(
             g=wg,
             start_id=start_id,
@@ -59,7 +70,10 @@ def run_hybrid_ga_physarum(
             start_time_min=hy_cfg.start_time_min,
             late_penalty=hy_cfg.late_penalty,
             cfg=ga_cfg,
+            inst=inst,
         )
+        if inst is not None:
+            inst.tags.pop("outer_iter", None)
 
         # Evaluate the same route on BASE graph (real cost)
         res_base = evaluate_route(
@@ -69,6 +83,8 @@ def run_hybrid_ga_physarum(
             late_penalty=hy_cfg.late_penalty,
         )
         base_cost = res_base.total_cost
+        if inst is not None:
+            inst.count("evaluations")
 
         print(f"[HY] iter {it:02d} | eff_cost {cost_eff:8.2f} | base_cost {base_cost:8.2f}")
 
@@ -78,11 +94,33 @@ def run_hybrid_ga_physarum(
             best_route = route_eff[:]
 
         # Update Physarum using base_cost (lebih stabil daripada eff_cost)
+        if timed:
+            t1 = time.perf_counter()
         phys.evaporate()
         phys.deposit_from_route(route_eff, base_cost)
+        if timed:
+            t2 = time.perf_counter()
 
         # Oscillatory pruning (in-place modifies phys.tau)
-        pruned = pruner.step_and_prune(phys.tau, it)
+        pruned = pruner.step_and_prune(phys.tau, it, phys.pruned)
+
+        if inst is not None:
+            t3 = time.perf_counter()
+            inst.add_time("hy.ga", t1 - t0)
+            inst.add_time("hy.physarum_update", t2 - t1)
+            inst.add_time("hy.prune", t3 - t2)
+            inst.count("pruned_edges", pruned)
+            inst.record(
+                "hy_iter",
+                iter=it,
+                eff_cost=cost_eff,
+                base_cost=base_cost,
+                ga_s=round(t1 - t0, 6),
+                physarum_s=round(t2 - t1, 6),
+                prune_s=round(t3 - t2, 6),
+                pruned=pruned,
+                edges_left=len(phys.tau),
+            )
 
         # Debug ringkas pruning
         if it == 1 or it % 2 == 0 or it == hy_cfg.outer_iters:
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Dict, Optional, Set, Tuple
 import math
 
 
@@ -22,7 +22,15 @@ class OscillatoryPruner:
         self.cfg = cfg
         self.bad_streak: Dict[Tuple[str, str], int] = {}  # edge -> streak count
 
-    def step_and_prune(self, tau: Dict[Tuple[str, str], float], t_iter: int) -> int:
+    def step_and_prune(
+        self,
+        tau: Dict[Tuple[str, str], float],
+        t_iter: int,
+        pruned: Optional[Set[Tuple[str, str]]] = None,
+    ) -> int:
+        """
+        pruned (opsional): edge yang dibuang ikut dicatat di sini (mis. PhysarumModel.pruned).
+        """
         if len(tau) <= self.cfg.min_edges_keep:
             return 0
 
@@ -46,5 +54,7 @@ class OscillatoryPruner:
         for e in candidates:
             tau.pop(e, None)
             self.bad_streak.pop(e, None)
+        if pruned is not None:
+            pruned.update(candidates)
 
         return len(candidates)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict, Tuple, List
+from typing import Dict, List, Optional, Set, Tuple
 
 
 @dataclass
@@ -14,16 +14,26 @@ class PhysarumModel:
     """
     Model conductance tau(u,v) untuk edge POI graph.
     Kita treat edge sebagai directed (u->v).
+
+    edges=None -> mode sparse (lazy matrix): tau hanya menyimpan edge yang pernah
+    di-deposit; edge lain memakai background (tau_init yang ikut ber-evaporasi),
+    jadi memori O(edge terpakai), bukan N^2. Edge yang dipruning dicatat di `pruned`.
     """
 
-    def __init__(self, edges: List[Tuple[str, str]], cfg: PhysarumConfig):
+    def __init__(self, edges: Optional[List[Tuple[str, str]]], cfg: PhysarumConfig):
         self.cfg = cfg
-        self.tau: Dict[Tuple[str, str], float] = {(u, v): cfg.tau_init for (u, v) in edges}
+        self.sparse = edges is None
+        self.tau: Dict[Tuple[str, str], float] = {}
+        if edges is not None:
+            self.tau = {(u, v): cfg.tau_init for (u, v) in edges}
+        self.background = cfg.tau_init
+        self.pruned: Set[Tuple[str, str]] = set()
 
     def evaporate(self):
         r = self.cfg.evap_rate
         for k in list(self.tau.keys()):
             self.tau[k] = max(self.cfg.eps, (1.0 - r) * self.tau[k])
+        self.background = max(self.cfg.eps, (1.0 - r) * self.background)
 
     def deposit_from_route(self, route: List[str], base_cost: float):
         """
@@ -40,10 +50,12 @@ class PhysarumModel:
             key = (u, v)
             if key in self.tau:
                 self.tau[key] += delta
+            elif self.sparse and key not in self.pruned:
+                self.tau[key] = self.background + delta
 
     def effective_weight(self, u: str, v: str, base_w: float) -> float:
         """
         Hitung bobot efektif dari base_w dan tau.
         """
-        tau_uv = self.tau.get((u, v), self.cfg.tau_init)
+        tau_uv = self.tau.get((u, v), self.background)
         return float(base_w) / (self.cfg.eps + tau_uv)
@@ -0,0 +1,301 @@
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Set, Tuple
+
+from src.model.graph import Graph
+from src.algorithms.greedy import _simulate_move_cost, greedy_timewindow_aware
+from src.algorithms.ga.ga_core import run_ga, GAConfig
+from src.eval.instrument import Instrument
+
+
+@dataclass
+class ReplanConfig:
+    late_penalty: float = 10.0
+    improve_passes: int = 2            # maksimal pass relocate setelah insertion
+    relocate_radius: int = 2           # hanya stop sejauh <= radius dari posisi insert/remove
+    relocate_span: int = 10            # posisi tujuan relocate: <= span dari posisi asal
+    relocate_max_stops: int = 16       # batas stop yang dicoba per pass
+    relocate_time_s: Optional[float] = None  # opsional: batas waktu relocate (hasil jadi tergantung mesin)
+    degrade_threshold: float = 0.10    # fallback kalau repaired > (1 + thr) * reference
+    greedy_reference: bool = False     # reference = greedy baru (O(n^2)) alih-alih rute masuk
+    fallback_ga: GAConfig = field(default_factory=GAConfig)
+
+
+@dataclass
+class ReplanResult:
+    route: List[str]
+    cost: float
+    repaired_cost: float
+    reference_cost: float
+    used_fallback: bool
+
+
+def _schedule(
+    g: Graph, route: List[str], start_time_min: int, late_penalty: float
+) -> Tuple[List[int], List[float], List[int]]:
+    """
+    Prefix schedule: depart[k], cum_cost[k], cum_late[k] setelah service di stop k.
+    Stop 0 disimulasikan sebagai move start->start (travel 0), sama dengan evaluate_route.
+    """
+    depart: List[int] = []
+    cum_cost: List[float] = []
+    cum_late: List[int] = []
+    t = start_time_min
+    c = 0.0
+    late_sum = 0
+    prev = route[0]
+    for pid in route:
+        inc, t, _, late = _simulate_move_cost(g, prev, pid, t, late_penalty)
+        c += inc
+        late_sum += late
+        depart.append(t)
+        cum_cost.append(c)
+        cum_late.append(late_sum)
+        prev = pid
+    return depart, cum_cost, cum_late
+
+
+def _insertion_cost(
+    g: Graph,
+    route: List[str],
+    sched: Tuple[List[int], List[float], List[int]],
+    pos: int,
+    poi_id: str,
+    late_penalty: float,
+) -> Tuple[float, int]:
+    """
+    Total (cost, late) kalau poi_id disisipkan sebelum route[pos].
+    Suffix hanya disimulasikan sampai waktu depart kembali sama dengan schedule lama;
+    setelah itu sisa cost identik dan diambil dari prefix.
+    """
+    depart, cum_cost, cum_late = sched
+    last = len(route) - 1
+    i = pos - 1
+    inc, t, _, late = _simulate_move_cost(g, route[i], poi_id, depart[i], late_penalty)
+    c = cum_cost[i] + inc
+    late_sum = cum_late[i] + late
+    prev = poi_id
+    for k in range(pos, last + 1):
+        inc, t, _, late = _simulate_move_cost(g, prev, route[k], t, late_penalty)
+        c += inc
+        late_sum += late
+        if t == depart[k]:
+            return c + (cum_cost[last] - cum_cost[k]), late_sum + (cum_late[last] - cum_late[k])
+        prev = route[k]
+    return c, late_sum
+
+
+def _best_insertion(
+    g: Graph,
+    route: List[str],
+    start_time_min: int,
+    poi_id: str,
+    late_penalty: float,
+) -> Tuple[Tuple[bool, float], int]:
+    """
+    Posisi insertion termurah. Key (tambah telat?, cost): posisi yang tidak menambah
+    keterlambatan (feasible terhadap time window) selalu didahulukan.
+    """
+    sched = _schedule(g, route, start_time_min, late_penalty)
+    base_late = sched[2][-1]
+    best_key = None
+    best_pos = 1
+    for pos in range(1, len(route)):
+        cost, late = _insertion_cost(g, route, sched, pos, poi_id, late_penalty)
+        key = (late > base_late, cost)
+        if best_key is None or key < best_key:
+            best_key, best_pos = key, pos
+    return best_key, best_pos
+
+
+def _route_cost(g: Graph, route: List[str], start_time_min: int, late_penalty: float) -> float:
+    return _schedule(g, route, start_time_min, late_penalty)[1][-1]
+
+
+def _schedule_from(
+    g: Graph,
+    route: List[str],
+    sched: Tuple[List[int], List[float], List[int]],
+    start: int,
+    late_penalty: float,
+) -> Tuple[List[int], List[float], List[int]]:
+    """
+    Schedule route, dengan prefix [0, start) diambil dari sched milik rute lain
+    yang prefix-nya identik; hanya suffix yang disimulasikan.
+    """
+    depart, cum_cost, cum_late = (x[:start] for x in sched)
+    t, c, late_sum = depart[-1], cum_cost[-1], cum_late[-1]
+    prev = route[start - 1]
+    for pid in route[start:]:
+        inc, t, _, late = _simulate_move_cost(g, prev, pid, t, late_penalty)
+        c += inc
+        late_sum += late
+        depart.append(t)
+        cum_cost.append(c)
+        cum_late.append(late_sum)
+        prev = pid
+    return depart, cum_cost, cum_late
+
+
+def _relocate_pass(
+    g: Graph,
+    route: List[str],
+    start_time_min: int,
+    late_penalty: float,
+    anchors: Set[str],
+    cfg: ReplanConfig,
+    deadline: Optional[float],
+) -> bool:
+    """
+    Satu pass relocate terbatas: hanya stop interior di sekitar anchors (POI yang
+    disisipkan / tetangga POI yang dibuang) yang dicabut lalu disisipkan di posisi
+    terbaik dalam jarak relocate_span. Schedule rute tanpa stop i memakai ulang prefix [0, i).
+    Return True kalau ada perbaikan.
+    """
+    where = {pid: k for k, pid in enumerate(route)}
+    last = len(route) - 1
+    radius, span = cfg.relocate_radius, cfg.relocate_span
+    cand: Set[str] = set()
+    for a in anchors:
+        k = where.get(a)
+        if k is not None:
+            cand.update(route[max(1, k - radius):min(last, k + radius + 1)])
+    order = sorted(cand, key=where.__getitem__)[:cfg.relocate_max_stops]
+
+    improved = False
+    sched = _schedule(g, route, start_time_min, late_penalty)
+    cur_cost = sched[1][-1]
+    for pid in order:
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        i = route.index(pid)
+        trial = route[:i] + route[i + 1:]
+        tsched = _schedule_from(g, trial, sched, i, late_penalty)
+        best_cost, best_pos = cur_cost, None
+        for pos in range(max(1, i - span), min(len(trial), i + span + 1)):
+            cost, _ = _insertion_cost(g, trial, tsched, pos, pid, late_penalty)
+            if cost < best_cost - 1e-9:
+                best_cost, best_pos = cost, pos
+        if best_pos is not None:
+            trial.insert(best_pos, pid)
+            route[:] = trial
+            sched = _schedule_from(g, route, tsched, best_pos, late_penalty)
+            cur_cost = best_cost
+            improved = True
+    return improved
+
+
+def replan_route(
+    g: Graph,
+    route: List[str],
+    start_time_min: int,
+    insert_ids: Iterable[str] = (),
+    remove_ids: Iterable[str] = (),
+    cfg: Optional[ReplanConfig] = None,
+    inst: Optional[Instrument] = None,
+) -> ReplanResult:
+    """
+    Re-planning incremental dari rute yang sudah ada (route[0]=start, route[-1]=end):
+      (1) buang remove_ids
+      (2) cheapest feasible insertion untuk insert_ids (satu per satu, yang termurah dulu)
+      (3) beberapa pass relocate, terbatas pada stop di sekitar perubahan
+          (relocate_radius / relocate_span / relocate_max_stops)
+      (4) kalau hasilnya lebih buruk dari (1 + degrade_threshold) * reference, full solve dengan run_ga
+    reference = cost rute masuk pada start_time_min baru (atau greedy kalau cfg.greedy_reference).
+    Selama masih di dalam threshold, rute hasil repair yang dipakai (urutan stop tetap stabil).
+    start_time_min boleh berbeda dari rencana awal (jadwal digeser).
+    """
+    if cfg is None:
+        cfg = ReplanConfig()
+    if len(route) < 2:
+        raise ValueError("Route must contain start and end")
+    lp = cfg.late_penalty
+    start_id, end_id = route[0], route[-1]
+
+    remove = set(remove_ids)
+    if start_id in remove or end_id in remove:
+        raise ValueError("Cannot remove start/end from route")
+    # anchors: tetangga stop yang dibuang + POI yang disisipkan (titik awal relocate)
+    new_route: List[str] = []
+    anchors: Set[str] = set()
+    gap = False
+    for pid in route:
+        if pid in remove:
+            if new_route:
+                anchors.add(new_route[-1])
+            gap = True
+            continue
+        if gap:
+            anchors.add(pid)
+            gap = False
+        new_route.append(pid)
+
+    present = set(new_route)
+    pending = []
+    for pid in insert_ids:
+        if pid not in g.pois:
+            raise KeyError(f"POI not found: {pid}")
+        if pid not in present:
+            pending.append(pid)
+            present.add(pid)
+
+    # cheapest insertion: tiap ronde pilih (POI, posisi) dengan key terkecil
+    while pending:
+        best = None
+        for pid in pending:
+            key, pos = _best_insertion(g, new_route, start_time_min, pid, lp)
+            if best is None or key < best[0]:
+                best = (key, pid, pos)
+        _, pid, pos = best
+        new_route.insert(pos, pid)
+        pending.remove(pid)
+        anchors.add(pid)
+        if inst is not None:
+            inst.count("replan.insertions")
+
+    deadline = None if cfg.relocate_time_s is None else time.perf_counter() + cfg.relocate_time_s
+    for _ in range(cfg.improve_passes):
+        if not _relocate_pass(g, new_route, start_time_min, lp, anchors, cfg, deadline):
+            break
+
+    repaired_cost = _route_cost(g, new_route, start_time_min, lp)
+
+    visit_ids = new_route[1:-1]
+    greedy: Optional[List[str]] = None
+    if cfg.greedy_reference:
+        greedy = greedy_timewindow_aware(g, start_id, end_id, visit_ids, start_time_min, lp)
+        reference_cost = _route_cost(g, greedy, start_time_min, lp)
+    else:
+        reference_cost = _route_cost(g, route, start_time_min, lp)
+
+    result = ReplanResult(
+        route=new_route,
+        cost=repaired_cost,
+        repaired_cost=repaired_cost,
+        reference_cost=reference_cost,
+        used_fallback=False,
+    )
+    if repaired_cost <= (1.0 + cfg.degrade_threshold) * reference_cost:
+        return result
+
+    # kualitas turun terlalu jauh -> full solve
+    if inst is not None:
+        inst.count("replan.fallbacks")
+    ga_route, ga_cost = run_ga(
+        g=g,
+        start_id=start_id,
+        end_id=end_id,
+        visit_ids=visit_ids,
+        start_time_min=start_time_min,
+        late_penalty=lp,
+        cfg=cfg.fallback_ga,
+        inst=inst,
+    )
+    result.used_fallback = True
+    candidates = [(ga_route, ga_cost)]
+    if greedy is not None:
+        candidates.append((greedy, reference_cost))
+    for cand_route, cand_cost in candidates:
+        if cand_cost < result.cost:
+            result.route, result.cost = cand_route, cand_cost
+    return result
@@ -0,0 +1,414 @@
+"""
+Entry point CLI: subcommand validate / greedy / ga / hybrid / replan / bench / demo.
+
+    python main.py ga --config my_run.json --visit B,C,D,E,F --json
+    python main.py bench --sizes 10,50
+
+Default diambil dari configs/default.json; --config di-merge di atasnya.
+Path relatif di config (data.*, log.dir) di-resolve terhadap folder file config-nya
+(default.json -> root repo), jadi CLI bisa dijalankan dari cwd mana pun (mis. cron).
+Modul solver di-import di dalam handler masing-masing, jadi `greedy` tidak
+membayar import GA/Physarum. Timing startup + tiap stage dicetak ke stderr.
+"""
+import time
+
+_T_START = time.perf_counter()
+
+import argparse  # noqa: E402
+import contextlib  # noqa: E402
+import copy  # noqa: E402
+import json  # noqa: E402
+import os  # noqa: E402
+import sys  # noqa: E402
+from typing import Any, Dict, Iterator, List, Optional, Tuple  # noqa: E402
+
+# satu-satunya sumber default (path relatif ke root repo, bukan cwd)
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CONFIG_PATH = os.path.join(_REPO_ROOT, "configs", "default.json")
+
+
+class StageTimer:
+    """
+    Durasi per stage; stage pertama dihitung sejak modul ini mulai di-import.
+    """
+    def __init__(self):
+        self.stages: List[Tuple[str, float]] = []
+        self._t = _T_START
+
+    def mark(self, name: str) -> None:
+        now = time.perf_counter()
+        self.stages.append((name, now - self._t))
+        self._t = now
+
+    def report(self) -> str:
+        parts = [f"{name} {sec:.3f}s" for name, sec in self.stages]
+        total = sum(sec for _, sec in self.stages)
+        return "[TIME] " + " | ".join(parts) + f" | total {total:.3f}s"
+
+
+def _merge(base: Dict[str, Any], over: Dict[str, Any]) -> Dict[str, Any]:
+    # deep copy: hasil merge boleh dimodifikasi tanpa mengubah base / over
+    out = copy.deepcopy(base)
+    for k, v in over.items():
+        if isinstance(v, dict) and isinstance(out.get(k), dict):
+            out[k] = _merge(out[k], v)
+        else:
+            out[k] = copy.deepcopy(v)
+    return out
+
+
+# key path di config: (section, key)
+_PATH_KEYS = (("data", "pois"), ("data", "matrix"), ("log", "dir"))
+
+
+def _read_json(path: str, base_dir: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        cfg = json.load(f)
+    for section, key in _PATH_KEYS:
+        value = cfg.get(section, {}).get(key)
+        if value and not os.path.isabs(value):
+            cfg[section][key] = os.path.normpath(os.path.join(base_dir, value))
+    return cfg
+
+
+def load_config(path: Optional[str]) -> Dict[str, Any]:
+    """
+    Config JSON di-merge di atas configs/default.json (key yang tidak diisi pakai default).
+    Selalu dibaca ulang, jadi override di satu run tidak bocor ke run berikutnya.
+    Path relatif: default.json -> root repo, file --config -> folder file tersebut.
+    """
+    cfg = _read_json(DEFAULT_CONFIG_PATH, _REPO_ROOT)
+    if path is None:
+        return cfg
+    return _merge(cfg, _read_json(path, os.path.dirname(os.path.abspath(path))))
+
+
+def _apply_overrides(cfg: Dict[str, Any], args: argparse.Namespace) -> None:
+    prob = cfg["problem"]
+    if getattr(args, "start", None):
+        prob["start_id"] = args.start
+    if getattr(args, "end", None):
+        prob["end_id"] = args.end
+    if getattr(args, "visit", None):
+        prob["visit_ids"] = [x.strip() for x in args.visit.split(",") if x.strip()]
+    if getattr(args, "start_time", None) is not None:
+        prob["start_time"] = args.start_time
+    if getattr(args, "seed", None) is not None:
+        cfg["ga"]["seed"] = args.seed
+    if getattr(args, "lazy", False):
+        cfg["data"]["lazy"] = True
+
+
+def _load_graph(cfg: Dict[str, Any]):
+    from src.model.graph import Graph, load_pois, load_time_matrix
+
+    data = cfg["data"]
+    pois = load_pois(data["pois"])
+    matrix = data.get("matrix")
+    times = load_time_matrix(matrix) if matrix else {}
+    estimator = None
+    if data.get("lazy"):
+        from src.model.geo import GeoEstimator, SpeedModel
+
+        estimator = GeoEstimator(pois, SpeedModel(**data.get("speed", {})))
+    return Graph(pois, times, estimator=estimator)
+
+
+@contextlib.contextmanager
+def _solver_output(args: argparse.Namespace) -> Iterator[None]:
+    # --quiet: log progress solver ([GA]/[HY]/[PR]) dibuang;
+    # --json: dipindah ke stderr supaya stdout hanya berisi satu baris JSON
+    if args.quiet:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            yield
+    elif args.json:
+        with contextlib.redirect_stdout(sys.stderr):
+            yield
+    else:
+        yield
+
+
+def _emit(args: argparse.Namespace, g, route: List[str], cfg: Dict[str, Any], extra: Dict[str, Any]) -> None:
+    from src.model.objective import evaluate_route
+
+    prob = cfg["problem"]
+    res = evaluate_route(g, route, start_time_min=prob["start_time"], late_penalty=prob["late_penalty"])
+    if args.json:
+        out = {
+            "route": route,
+            "cost": res.total_cost,
+            "travel": res.total_travel,
+            "wait": res.total_wait,
+            "late": res.total_late,
+        }
+        out.update(extra)
+        print(json.dumps(out))
+        return
+    print("Route:", " -> ".join(route))
+    print(f"Travel {res.total_travel} | Wait {res.total_wait} | Late {res.total_late} | Cost {res.total_cost:.2f}")
+    if args.schedule:
+        from src.model.objective import print_schedule
+
+        print_schedule(g, res)
+
+
+def cmd_validate(args: argparse.Namespace, cfg: Dict[str, Any], timer: StageTimer) -> int:
+    from src.model.validate import reachable_from, validate_graph
+
+    g = _load_graph(cfg)
+    timer.mark("load")
+    errors = validate_graph(g)
+    start_id = cfg["problem"]["start_id"]
+    reach = reachable_from(g, start_id)
+    timer.mark("validate")
+
+    unreachable = sorted(set(g.pois.keys()) - reach)
+    if args.json:
+        print(json.dumps({"errors": errors, "reachable": len(reach), "pois": len(g.pois), "unreachable": unreachable}))
+    else:
+        for e in errors:
+            print("-", e)
+        print(f"Reachable from {start_id}: {len(reach)}/{len(g.pois)}")
+        if unreachable:
+            print("Not reachable:", unreachable)
+    return 1 if errors or unreachable else 0
+
+
+def cmd_greedy(args: argparse.Namespace, cfg: Dict[str, Any], timer: StageTimer) -> int:
+    from src.algorithms.greedy import greedy_nearest_feasible, greedy_timewindow_aware
+
+    g = _load_graph(cfg)
+    timer.mark("load")
+    p = cfg["problem"]
+    if args.travel_only:
+        route = greedy_nearest_feasible(g, p["start_id"], p["end_id"], p["visit_ids"], p["start_time"])
+    else:
+        route = greedy_timewindow_aware(
+            g, p["start_id"], p["end_id"], p["visit_ids"], p["start_time"], p["late_penalty"]
+        )
+    timer.mark("solve")
+    _emit(args, g, route, cfg, {"solver": "greedy"})
+    return 0
+
+
+def _open_log(args: argparse.Namespace, prefix: str, configs: Dict[str, Any], cfg: Dict[str, Any]):
+    # Instrument dibuat kalau ada --log (record ke .jsonl) atau --profile
+    if not args.log and not args.profile:
+        return None, None
+    from src.eval.instrument import Instrument
+
+    log = None
+    if args.log:
+        from src.eval.logger import RunLogWriter
+
+        p = cfg["problem"]
+        log = RunLogWriter(prefix, run_dir=cfg["log"]["dir"])
+        log.write_header(
+            configs,
+            visit_ids=p["visit_ids"],
+            start_id=p["start_id"],
+            end_id=p["end_id"],
+            start_time=p["start_time"],
+            late_penalty=p["late_penalty"],
+        )
+    return log, Instrument(sink=log)
+
+
+def _profiled(args: argparse.Namespace, inst):
+    # --profile: cProfile + tracemalloc di sekitar solve, hasil di inst.profile
+    if inst is None or not args.profile:
+        return contextlib.nullcontext()
+    return inst.profiled(cprofile=True, trace_memory=True)
+
+
+def _close_log(args: argparse.Namespace, log, inst, route: List[str], cost: float) -> Optional[str]:
+    if inst is None:
+        return None
+    if args.profile:
+        prof = inst.profile
+        if log is None:
+            print(prof.get("cprofile", ""), file=sys.stderr)
+        print(
+            f"[PROFILE] wall {prof.get('wall_s', 0.0):.3f}s | peak_mem {prof.get('peak_mem_kb', 0.0):.1f} KB",
+            file=sys.stderr,
+        )
+    if log is None:
+        return None
+    fields: Dict[str, Any] = {"counters": inst.counters, "timers": inst.timers}
+    if inst.profile:
+        fields["profile"] = inst.profile
+    log.write_result(best_route=route, best_cost=cost, **fields)
+    return log.close()
+
+
+def cmd_ga(args: argparse.Namespace, cfg: Dict[str, Any], timer: StageTimer) -> int:
+    from src.algorithms.ga.ga_core import GAConfig, run_ga
+
+    g = _load_graph(cfg)
+    timer.mark("load")
+    p = cfg["problem"]
+    ga_cfg = GAConfig(**cfg["ga"])
+    log, inst = _open_log(args, "ga_run", {"ga_cfg": ga_cfg}, cfg)
+    try:
+        with _solver_output(args), _profiled(args, inst):
+            route, cost = run_ga(
+                g=g,
+                start_id=p["start_id"],
+                end_id=p["end_id"],
+                visit_ids=p["visit_ids"],
+                start_time_min=p["start_time"],
+                late_penalty=p["late_penalty"],
+                cfg=ga_cfg,
+                inst=inst,
+            )
+        timer.mark("solve")
+        path = _close_log(args, log, inst, route, cost)
+    finally:
+        if log is not None:
+            log.close()  # idempotent; buffer tetap ditulis kalau solver raise
+    _emit(args, g, route, cfg, {"solver": "ga", "log": path})
+    return 0
+
+
+def cmd_hybrid(args: argparse.Namespace, cfg: Dict[str, Any], timer: StageTimer) -> int:
+    from src.algorithms.ga.ga_core import GAConfig
+    from src.algorithms.hybrid.ga_physarum import HybridConfig, run_hybrid_ga_physarum
+    from src.algorithms.physarum.oscillatory_pruning import PruneConfig
+    from src.algorithms.physarum.physarum_core import PhysarumConfig
+
+    g = _load_graph(cfg)
+    timer.mark("load")
+    p = cfg["problem"]
+    # "hybrid.ga": override GAConfig khusus GA di dalam loop hybrid (lebih ringan dari "ga")
+    hy = dict(cfg["hybrid"])
+    ga_cfg = GAConfig(**_merge(cfg["ga"], hy.pop("ga", {})))
+    phy_cfg = PhysarumConfig(**cfg["physarum"])
+    hy_cfg = HybridConfig(**_merge(hy, {"late_penalty": p["late_penalty"], "start_time_min": p["start_time"]}))
+    pr_cfg = PruneConfig(**cfg["prune"])
+    log, inst = _open_log(
+        args,
+        "hybrid_pruning_run",
+        {"ga_cfg": ga_cfg, "phy_cfg": phy_cfg, "hy_cfg": hy_cfg, "pr_cfg": pr_cfg},
+        cfg,
+    )
+    try:
+        with _solver_output(args), _profiled(args, inst):
+            route, cost = run_hybrid_ga_physarum(
+                base_g=g,
+                start_id=p["start_id"],
+                end_id=p["end_id"],
+                visit_ids=p["visit_ids"],
+                ga_cfg=ga_cfg,
+                phy_cfg=phy_cfg,
+                hy_cfg=hy_cfg,
+                pr_cfg=pr_cfg,
+                inst=inst,
+            )
+        timer.mark("solve")
+        path = _close_log(args, log, inst, route, cost)
+    finally:
+        if log is not None:
+            log.close()
+    _emit(args, g, route, cfg, {"solver": "hybrid", "log": path})
+    return 0
+
+
+def cmd_replan(args: argparse.Namespace, cfg: Dict[str, Any], timer: StageTimer) -> int:
+    from src.algorithms.ga.ga_core import GAConfig
+    from src.algorithms.replan import ReplanConfig, replan_route
+
+    g = _load_graph(cfg)
+    timer.mark("load")
+    p = cfg["problem"]
+    route = [x.strip() for x in args.route.split(",") if x.strip()]
+    rp_cfg = ReplanConfig(late_penalty=p["late_penalty"], fallback_ga=GAConfig(**cfg["ga"]))
+    with _solver_output(args):
+        res = replan_route(
+            g,
+            route,
+            start_time_min=p["start_time"],
+            insert_ids=[x for x in (args.add or "").split(",") if x],
+            remove_ids=[x for x in (args.drop or "").split(",") if x],
+            cfg=rp_cfg,
+        )
+    timer.mark("solve")
+    _emit(args, g, res.route, cfg, {"solver": "replan", "used_fallback": res.used_fallback})
+    return 0
+
+
+def cmd_demo(args: argparse.Namespace, cfg: Dict[str, Any], timer: StageTimer) -> int:
+    from src.demo import run_demo
+
+    run_demo(_REPO_ROOT)
+    timer.mark("demo")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(prog="main.py", description="POI route optimization")
+    sub = ap.add_subparsers(dest="command")
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--config", help="JSON config (merged over configs/default.json)")
+    common.add_argument("--start", help="start POI id")
+    common.add_argument("--end", help="end POI id")
+    common.add_argument("--visit", help="comma-separated POI ids to visit")
+    common.add_argument("--start-time", type=int, help="start time in minutes (480 = 08:00)")
+    common.add_argument("--lazy", action="store_true", help="estimate missing edges from lat/lon")
+    common.add_argument("--json", action="store_true", help="print result as one JSON line (progress goes to stderr)")
+    common.add_argument("--schedule", action="store_true", help="print the full schedule")
+    common.add_argument("--quiet", action="store_true", help="hide solver progress output")
+    common.add_argument("--no-timings", action="store_true", help="do not print stage timings to stderr")
+
+    sub.add_parser("validate", parents=[common], help="validate graph + reachability")
+    p = sub.add_parser("greedy", parents=[common], help="greedy baseline")
+    p.add_argument("--travel-only", action="store_true", help="nearest-neighbour on travel time only")
+    for name, helptext in (("ga", "genetic algorithm"), ("hybrid", "GA + Physarum + pruning")):
+        p = sub.add_parser(name, parents=[common], help=helptext)
+        p.add_argument("--seed", type=int)
+        p.add_argument("--log", action="store_true", help="write a .jsonl run log to runs/")
+        p.add_argument("--profile", action="store_true", help="cProfile + tracemalloc the solve (slow)")
+    p = sub.add_parser("replan", parents=[common], help="incremental re-planning of an existing route")
+    p.add_argument("--route", required=True, help="comma-separated existing route (start..end)")
+    p.add_argument("--add", help="comma-separated POI ids to insert")
+    p.add_argument("--drop", help="comma-separated POI ids to remove")
+    p.add_argument("--seed", type=int)
+    # demo memakai setting tetap (src/demo.py), jadi flag config/output tidak ditawarkan
+    p = sub.add_parser("demo", help="run milestone demo M1-M6")
+    p.add_argument("--no-timings", action="store_true", help="do not print stage timings to stderr")
+    sub.add_parser("bench", help="synthetic benchmark (see: bench --help)", add_help=False)
+    return ap
+
+
+_COMMANDS = {
+    "validate": cmd_validate,
+    "greedy": cmd_greedy,
+    "ga": cmd_ga,
+    "hybrid": cmd_hybrid,
+    "replan": cmd_replan,
+    "demo": cmd_demo,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        argv = ["demo"]
+
+    # bench punya parser sendiri; argumen diteruskan apa adanya
+    if argv[0] == "bench":
+        from src.eval.benchmark import main as bench_main
+
+        return bench_main(argv[1:])
+
+    timer = StageTimer()
+    args = build_parser().parse_args(argv)
+    timer.mark("startup")
+    cfg = load_config(getattr(args, "config", None))
+    _apply_overrides(cfg, args)
+    timer.mark("config")
+
+    rc = _COMMANDS[args.command](args, cfg, timer)
+    if not args.no_timings:
+        print(timer.report(), file=sys.stderr)
+    return rc
@@ -0,0 +1,287 @@
+"""
+Benchmark harness: instance sintetis + solver dengan seed tetap -> file JSON hasil
+yang bisa di-diff antar commit.
+
+Pakai (dari root repo):
+    python -m src.eval.benchmark --sizes 10,50,200 --out runs/bench.json
+    python -m src.eval.benchmark --compare runs/bench_old.json runs/bench_new.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.model.objective import evaluate_route
+from src.model.synthetic import SyntheticConfig, SyntheticInstance, generate_instance
+from src.algorithms.greedy import greedy_timewindow_aware
+from src.algorithms.ga.ga_core import run_ga, GAConfig
+from src.algorithms.hybrid.ga_physarum import run_hybrid_ga_physarum, HybridConfig
+from src.algorithms.physarum.physarum_core import PhysarumConfig
+from src.algorithms.physarum.oscillatory_pruning import PruneConfig
+from src.eval.instrument import Instrument
+
+SOLVERS = ("greedy", "ga", "hybrid")
+
+
+@dataclass
+class BenchConfig:
+    sizes: Tuple[int, ...] = (10, 50, 200)
+    coords: Tuple[str, ...] = ("uniform", "clustered")
+    windows: Tuple[str, ...] = ("loose", "tight")
+    solvers: Tuple[str, ...] = SOLVERS
+    instance_seed: int = 0
+    lazy: bool = False               # lazy matrix mode (wajib praktis untuk N >= ~2000)
+    late_penalty: float = 10.0
+    # GA dibuat lebih ringan dari main.py supaya N besar tetap selesai
+    population_size: int = 40
+    generations: int = 40
+    outer_iters: int = 3
+    solver_seed: int = 123
+    adaptive: bool = False
+    measure_memory: bool = False     # pass tracemalloc terpisah (menjalankan solver 2x)
+
+
+def _ga_cfg(bc: BenchConfig) -> GAConfig:
+    return GAConfig(
+        population_size=bc.population_size,
+        generations=bc.generations,
+        seed=bc.solver_seed,
+        adaptive=bc.adaptive,
+    )
+
+
+def _run_greedy(inst: SyntheticInstance, bc: BenchConfig) -> Tuple[List[str], Optional[int]]:
+    route = greedy_timewindow_aware(
+        inst.graph, inst.start_id, inst.end_id, inst.visit_ids, inst.start_time_min, bc.late_penalty
+    )
+    # greedy tidak memanggil evaluate_route (hanya simulasi satu move), jadi
+    # tidak sebanding dengan evaluasi full-route GA -> dilaporkan null
+    return route, None
+
+
+def _run_ga(inst: SyntheticInstance, bc: BenchConfig) -> Tuple[List[str], Optional[int]]:
+    cfg = _ga_cfg(bc)
+    meter = Instrument()
+    route, _ = run_ga(
+        g=inst.graph,
+        start_id=inst.start_id,
+        end_id=inst.end_id,
+        visit_ids=inst.visit_ids,
+        start_time_min=inst.start_time_min,
+        late_penalty=bc.late_penalty,
+        cfg=cfg,
+        inst=meter,
+    )
+    return route, meter.counters.get("evaluations", 0)
+
+
+def _run_hybrid(inst: SyntheticInstance, bc: BenchConfig) -> Tuple[List[str], Optional[int]]:
+    cfg = _ga_cfg(bc)
+    meter = Instrument()
+    route, _ = run_hybrid_ga_physarum(
+        base_g=inst.graph,
+        start_id=inst.start_id,
+        end_id=inst.end_id,
+        visit_ids=inst.visit_ids,
+        ga_cfg=cfg,
+        phy_cfg=PhysarumConfig(deposit_q=2.0),
+        hy_cfg=HybridConfig(
+            outer_iters=bc.outer_iters,
+            late_penalty=bc.late_penalty,
+            start_time_min=inst.start_time_min,
+        ),
+        pr_cfg=PruneConfig(),
+        inst=meter,
+    )
+    return route, meter.counters.get("evaluations", 0)
+
+
+_RUNNERS: Dict[str, Callable[[SyntheticInstance, BenchConfig], Tuple[List[str], Optional[int]]]] = {
+    "greedy": _run_greedy,
+    "ga": _run_ga,
+    "hybrid": _run_hybrid,
+}
+
+
+def _timed(fn: Callable[[], Any]) -> Tuple[Any, float]:
+    # stdout solver ([GA]/[HY] print) dibuang supaya tidak ikut mengotori hasil
+    with contextlib.redirect_stdout(io.StringIO()):
+        t0 = time.perf_counter()
+        out = fn()
+        wall = time.perf_counter() - t0
+    return out, wall
+
+
+def _peak_memory_kb(fn: Callable[[], Any]) -> float:
+    # pass terpisah: tracemalloc memperlambat eksekusi, jadi tidak dicampur dengan wall time
+    with contextlib.redirect_stdout(io.StringIO()):
+        tracemalloc.start()
+        try:
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return peak / 1024.0
+
+
+def bench_one(inst: SyntheticInstance, solver: str, bc: BenchConfig) -> Dict[str, Any]:
+    runner = _RUNNERS[solver]
+    (route, evaluations), wall = _timed(lambda: runner(inst, bc))
+    res = evaluate_route(inst.graph, route, start_time_min=inst.start_time_min, late_penalty=bc.late_penalty)
+
+    rec: Dict[str, Any] = {
+        "instance": inst.name,
+        "n_pois": len(inst.graph.pois),
+        "solver": solver,
+        "wall_s": round(wall, 6),
+        "evaluations": evaluations,
+        "evals_per_s": round(evaluations / wall, 2) if evaluations is not None and wall > 0 else None,
+        "cost": round(res.total_cost, 4),
+        "travel": res.total_travel,
+        "wait": res.total_wait,
+        "late": res.total_late,
+    }
+    if bc.measure_memory:
+        rec["peak_mem_kb"] = round(_peak_memory_kb(lambda: runner(inst, bc)), 1)
+    return rec
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        )
+        return out.stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(bc: BenchConfig, progress: bool = True) -> Dict[str, Any]:
+    results: List[Dict[str, Any]] = []
+    for n in bc.sizes:
+        for coords in bc.coords:
+            for windows in bc.windows:
+                inst = generate_instance(
+                    SyntheticConfig(
+                        n_pois=n, coords=coords, windows=windows, lazy=bc.lazy, seed=bc.instance_seed
+                    )
+                )
+                for solver in bc.solvers:
+                    rec = bench_one(inst, solver, bc)
+                    results.append(rec)
+                    if progress:
+                        print(
+                            f"[BENCH] {rec['instance']:<28} {solver:<6} | "
+                            f"wall {rec['wall_s']:9.3f}s | cost {rec['cost']:10.2f}"
+                        )
+
+    cfg = asdict(bc)
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "config": {k: list(v) if isinstance(v, tuple) else v for k, v in cfg.items()},
+        "results": results,
+    }
+
+
+def save_results(data: Dict[str, Any], path: Optional[str] = None) -> str:
+    if path is None:
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = f"runs/bench_{ts}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return path
+
+
+def compare_results(old: Dict[str, Any], new: Dict[str, Any]) -> List[str]:
+    """
+    Bandingkan dua file hasil per (instance, solver): rasio wall time dan selisih cost.
+    """
+    old_idx = {(r["instance"], r["solver"]): r for r in old["results"]}
+    lines: List[str] = []
+    for r in new["results"]:
+        o = old_idx.get((r["instance"], r["solver"]))
+        if o is None:
+            lines.append(f"{r['instance']:<28} {r['solver']:<6} | new only")
+            continue
+        speedup = o["wall_s"] / r["wall_s"] if r["wall_s"] > 0 else float("inf")
+        d_cost = r["cost"] - o["cost"]
+        lines.append(
+            f"{r['instance']:<28} {r['solver']:<6} | "
+            f"wall {o['wall_s']:9.3f}s -> {r['wall_s']:9.3f}s (x{speedup:5.2f}) | "
+            f"cost {d_cost:+.2f}"
+        )
+    return lines
+
+
+def _csv(s: str) -> Tuple[str, ...]:
+    return tuple(x.strip() for x in s.split(",") if x.strip())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Reproducible solver benchmark on synthetic instances")
+    ap.add_argument("--sizes", default="10,50,200", help="comma-separated POI counts (10..5000)")
+    ap.add_argument("--coords", default="uniform,clustered")
+    ap.add_argument("--windows", default="loose,tight")
+    ap.add_argument("--solvers", default=",".join(SOLVERS))
+    ap.add_argument("--instance-seed", type=int, default=0)
+    ap.add_argument("--solver-seed", type=int, default=123)
+    ap.add_argument("--population", type=int, default=BenchConfig.population_size)
+    ap.add_argument("--generations", type=int, default=BenchConfig.generations)
+    ap.add_argument("--outer-iters", type=int, default=BenchConfig.outer_iters)
+    ap.add_argument("--lazy", action="store_true", help="no precomputed matrix; estimate travel times from lat/lon")
+    ap.add_argument("--adaptive", action="store_true", help="GA adaptive operator rates / population")
+    ap.add_argument("--memory", action="store_true", help="extra tracemalloc pass per solver for peak_mem_kb (slow)")
+    ap.add_argument("--out", default=None, help="results path (default runs/bench_<ts>.json)")
+    ap.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="diff two results files")
+    args = ap.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0], encoding="utf-8") as f:
+            old = json.load(f)
+        with open(args.compare[1], encoding="utf-8") as f:
+            new = json.load(f)
+        for line in compare_results(old, new):
+            print(line)
+        return 0
+
+    solvers = _csv(args.solvers)
+    unknown = [s for s in solvers if s not in _RUNNERS]
+    if unknown:
+        ap.error(f"unknown solver(s): {', '.join(unknown)}")
+
+    bc = BenchConfig(
+        sizes=tuple(int(x) for x in _csv(args.sizes)),
+        coords=_csv(args.coords),
+        windows=_csv(args.windows),
+        solvers=solvers,
+        instance_seed=args.instance_seed,
+        lazy=args.lazy,
+        solver_seed=args.solver_seed,
+        population_size=args.population,
+        generations=args.generations,
+        outer_iters=args.outer_iters,
+        adaptive=args.adaptive,
+        measure_memory=args.memory,
+    )
+    data = run_benchmark(bc)
+    path = save_results(data, args.out)
+    print(f"Saved benchmark results: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
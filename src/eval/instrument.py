@@ -0,0 +1,91 @@
+"""
+Instrumentasi ringan untuk solver: counter, timer, dan record per iterasi.
+
+Solver menerima `inst: Optional[Instrument] = None`. Kalau None, semua hook dilewati
+dengan satu cek `is not None` (tidak ada perf_counter / alokasi tambahan).
+"""
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class Instrument:
+    def __init__(self, sink: Optional[Any] = None):
+        # sink: objek dengan write_record(dict), mis. RunLogWriter dari src.eval.logger
+        self.sink = sink
+        self.counters: Dict[str, int] = {}
+        self.timers: Dict[str, float] = {}
+        self.iterations: List[Dict[str, Any]] = []
+        self.profile: Dict[str, Any] = {}
+        # field yang ikut di setiap record, mis. {"outer_iter": 3} selama GA di dalam hybrid
+        self.tags: Dict[str, Any] = {}
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def add_time(self, name: str, seconds: float) -> None:
+        self.timers[name] = self.timers.get(name, 0.0) + seconds
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - t0)
+
+    def record(self, kind: str, **fields: Any) -> None:
+        """
+        Simpan satu record per iterasi (mis. kind="ga_gen" atau "hy_iter"),
+        dan teruskan ke sink kalau ada.
+        """
+        rec = {"kind": kind}
+        rec.update(self.tags)
+        rec.update(fields)
+        self.iterations.append(rec)
+        if self.sink is not None:
+            self.sink.write_record(rec)
+
+    @contextmanager
+    def profiled(self, cprofile: bool = False, trace_memory: bool = False, top: int = 25) -> Iterator[None]:
+        """
+        Bungkus satu run dengan cProfile dan/atau tracemalloc (opsional, mahal).
+        Hasilnya masuk ke self.profile. Modul profiling baru di-import di sini
+        supaya import solver tetap murah.
+        """
+        import cProfile
+        import io
+        import pstats
+        import tracemalloc
+
+        prof = cProfile.Profile() if cprofile else None
+        started_trace = False
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_trace = True
+        t0 = time.perf_counter()
+        if prof is not None:
+            prof.enable()
+        try:
+            yield
+        finally:
+            if prof is not None:
+                prof.disable()
+            self.profile["wall_s"] = time.perf_counter() - t0
+            if trace_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                self.profile["peak_mem_kb"] = peak / 1024.0
+                if started_trace:
+                    tracemalloc.stop()
+            if prof is not None:
+                buf = io.StringIO()
+                pstats.Stats(prof, stream=buf).sort_stats("cumulative").print_stats(top)
+                self.profile["cprofile"] = buf.getvalue()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "counters": dict(self.counters),
+            "timers": {k: round(v, 6) for k, v in self.timers.items()},
+            "iterations": list(self.iterations),
+            "profile": dict(self.profile),
+        }
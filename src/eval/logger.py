@@ -1,13 +1,202 @@
+import json
+import queue
+import threading
 from dataclasses import asdict
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
 def save_run_log(
     filename_prefix: str,
     content: str,
+    metrics: Optional[Dict[str, Any]] = None,
 ) -> str:
+    """
+    metrics (opsional, mis. Instrument.to_dict()) ditulis sebagai JSON
+    di samping file .txt dengan nama yang sama.
+    """
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     path = f"runs/{filename_prefix}_{ts}.txt"
     with open(path, "w", encoding="utf-8") as f:
         f.write(content)
+    if metrics is not None:
+        with open(f"runs/{filename_prefix}_{ts}.json", "w", encoding="utf-8") as f:
+            json.dump(metrics, f, indent=2, sort_keys=True)
     return path
+
+
+# =========================
+# Structured run log (JSON Lines)
+# =========================
+# Satu file .jsonl per run. Baris pertama kind="run" (header + config),
+# lalu record per generasi/iterasi, dan terakhir kind="result".
+# Key "kind" selalu di depan supaya reader bisa skip baris tanpa json.loads.
+
+_JSON_SEP = (",", ":")
+
+
+def config_to_dict(cfg: Any) -> Dict[str, Any]:
+    """
+    Schema ringkas untuk dataclass config: {"type": NamaClass, ...field}.
+    """
+    d: Dict[str, Any] = {"type": type(cfg).__name__}
+    d.update(asdict(cfg))
+    return d
+
+
+class RunLogWriter:
+    """
+    Writer JSON Lines yang di-buffer: record dikumpulkan di memori lalu dikirim
+    per batch ke thread penulis, jadi loop solver tidak menunggu disk.
+    Header ("run") ditulis + di-flush langsung, jadi run yang crash tetap punya header.
+    Pakai sebagai context manager (atau try/finally + close()) supaya buffer
+    tetap ditulis kalau solver raise.
+    """
+
+    def __init__(self, filename_prefix: str, buffer_size: int = 256, run_dir: str = "runs"):
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        self.run_id = f"{filename_prefix}_{ts}"
+        self.path = f"{run_dir}/{self.run_id}.jsonl"
+        self.buffer_size = buffer_size
+        self._buf: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()  # akses self._file (thread penulis vs header sinkron)
+        self._queue: "queue.Queue[Optional[List[Dict[str, Any]]]]" = queue.Queue()
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._thread = threading.Thread(target=self._drain, name="run-log-writer", daemon=True)
+        self._thread.start()
+        self._closed = False
+
+    def _drain(self) -> None:
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                break
+            lines = [json.dumps(rec, separators=_JSON_SEP) for rec in batch]
+            with self._io_lock:
+                self._file.write("\n".join(lines) + "\n")
+                self._file.flush()
+        self._file.close()
+
+    def write(self, kind: str, **fields: Any) -> None:
+        rec: Dict[str, Any] = {"kind": kind}
+        rec.update(fields)
+        self.write_record(rec)
+
+    def write_record(self, rec: Dict[str, Any]) -> None:
+        """
+        rec harus sudah punya key "kind" di urutan pertama.
+        """
+        batch = None
+        with self._lock:
+            self._buf.append(rec)
+            if len(self._buf) >= self.buffer_size:
+                batch, self._buf = self._buf, []
+        if batch is not None:
+            self._queue.put(batch)
+
+    def write_header(self, configs: Dict[str, Any], **meta: Any) -> None:
+        """
+        Sinkron (tidak lewat buffer); panggil sebelum record lain.
+        """
+        rec: Dict[str, Any] = {
+            "kind": "run",
+            "run_id": self.run_id,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "configs": {name: config_to_dict(cfg) for name, cfg in configs.items()},
+        }
+        rec.update(meta)
+        line = json.dumps(rec, separators=_JSON_SEP)
+        with self._io_lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def write_result(self, **fields: Any) -> None:
+        self.write("result", run_id=self.run_id, **fields)
+
+    def flush(self) -> None:
+        with self._lock:
+            batch, self._buf = self._buf, []
+        if batch:
+            self._queue.put(batch)
+
+    def close(self) -> str:
+        if not self._closed:
+            self.flush()
+            self._queue.put(None)
+            self._thread.join()
+            self._closed = True
+        return self.path
+
+    def __enter__(self) -> "RunLogWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+_HEAD_RUN = '{"kind":"run"'
+_HEAD_RESULT = '{"kind":"result"'
+
+
+def read_run_log(path: str, kinds: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Iterasi record dari satu file .jsonl; kinds membatasi jenis record yang di-parse.
+    """
+    heads = None if kinds is None else tuple('{"kind":"%s"' % k for k in kinds)
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if heads is not None and not line.startswith(heads):
+                continue
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def load_run_summaries(paths: Iterable[str]) -> List[Dict[str, Any]]:
+    """
+    Satu dict per run: header ("run") digabung dengan "result".
+    Record per generasi tidak di-parse sama sekali, jadi cepat untuk ribuan file.
+    Run tanpa result (mis. crash) tetap ikut dengan result=None.
+    """
+    out: List[Dict[str, Any]] = []
+    for path in paths:
+        header: Dict[str, Any] = {}
+        result: Optional[Dict[str, Any]] = None
+        for rec in read_run_log(path, kinds=("run", "result")):
+            if rec["kind"] == "run":
+                header = rec
+            else:
+                result = rec
+        summary = dict(header)
+        summary.pop("kind", None)
+        summary["path"] = path
+        summary["result"] = result
+        out.append(summary)
+    return out
+
+
+def aggregate_runs(
+    summaries: Iterable[Dict[str, Any]],
+    group_by: Callable[[Dict[str, Any]], Any],
+    value: str = "best_cost",
+) -> Dict[Any, Dict[str, float]]:
+    """
+    Agregasi result[value] per grup: n, mean, min, max.
+    group_by menerima summary (mis. lambda s: s["configs"]["ga_cfg"]["population_size"]).
+    """
+    groups: Dict[Any, List[float]] = {}
+    for s in summaries:
+        res = s.get("result")
+        if not res or value not in res:
+            continue
+        groups.setdefault(group_by(s), []).append(float(res[value]))
+
+    agg: Dict[Any, Dict[str, float]] = {}
+    for key, vals in groups.items():
+        agg[key] = {
+            "n": len(vals),
+            "mean": sum(vals) / len(vals),
+            "min": min(vals),
+            "max": max(vals),
+        }
+    return agg
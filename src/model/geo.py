@@ -0,0 +1,66 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+import math
+
+from .graph import POI
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    p1 = math.radians(lat1)
+    p2 = math.radians(lat2)
+    dp = p2 - p1
+    dl = math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+@dataclass
+class SpeedModel:
+    speed_kmh: float = 25.0      # kecepatan rata-rata kota
+    detour: float = 1.3          # faktor jalan vs garis lurus
+    min_minutes: float = 1.0     # batas bawah travel time antar POI berbeda
+    round_minutes: bool = True   # bulatkan ke menit (sama dengan time_matrix.csv)
+
+
+class GeoEstimator:
+    """
+    Estimasi travel time dari lat/lon POI: haversine * detour / speed.
+    Radian dan cos(lat) tiap POI dihitung sekali di __init__, jadi estimate_many
+    (bulk fill) hanya perlu sin/asin per pasangan.
+    """
+
+    def __init__(self, pois: Dict[str, POI], model: Optional[SpeedModel] = None):
+        self.model = model if model is not None else SpeedModel()
+        self._lat: Dict[str, float] = {}
+        self._lon: Dict[str, float] = {}
+        self._cos: Dict[str, float] = {}
+        for pid, p in pois.items():
+            lat = math.radians(p.lat)
+            self._lat[pid] = lat
+            self._lon[pid] = math.radians(p.lon)
+            self._cos[pid] = math.cos(lat)
+        self._min_per_km = 60.0 / self.model.speed_kmh * self.model.detour
+
+    def estimate(self, u: str, v: str) -> float:
+        return self.estimate_many([(u, v)])[0]
+
+    def estimate_many(self, pairs: Iterable[Tuple[str, str]]) -> List[float]:
+        lat, lon, cos = self._lat, self._lon, self._cos
+        sin, asin, sqrt = math.sin, math.asin, math.sqrt
+        scale = 2 * EARTH_RADIUS_KM * self._min_per_km
+        lo = self.model.min_minutes
+        rnd = self.model.round_minutes
+
+        out: List[float] = []
+        append = out.append
+        for u, v in pairs:
+            s_dp = sin((lat[v] - lat[u]) * 0.5)
+            s_dl = sin((lon[v] - lon[u]) * 0.5)
+            a = s_dp * s_dp + cos[u] * cos[v] * s_dl * s_dl
+            m = scale * asin(sqrt(a))
+            if rnd:
+                m = float(round(m))
+            append(m if m > lo else lo)
+        return out
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple
 import csv
 
 @dataclass(frozen=True)
@@ -13,17 +13,79 @@ class POI:
     service_min: int
 
 class Graph:
-    def __init__(self, pois: Dict[str, POI], travel_min: Dict[Tuple[str, str], float]):
+    """
+    travel_min berisi edge yang diukur (dari time_matrix.csv).
+    Kalau estimator diisi (lazy matrix mode, mis. GeoEstimator dari src.model.geo),
+    edge yang tidak ada di travel_min diestimasi saat dibutuhkan dan di-cache
+    di self.estimated; travel_min sendiri tidak diubah.
+
+    Ubah edge lewat set_edge/remove_edge; kalau pois/travel_min diubah langsung,
+    panggil invalidate_index() supaya GraphIndex (validasi/reachability) dibangun ulang.
+    """
+    def __init__(
+        self,
+        pois: Dict[str, POI],
+        travel_min: Dict[Tuple[str, str], float],
+        estimator: Optional[Any] = None,
+    ):
         self.pois = pois
         self.travel_min = travel_min
+        self.estimator = estimator
+        self.estimated: Dict[Tuple[str, str], float] = {}
+        self._index = None  # cache GraphIndex (lihat src.model.graph_index.get_index)
+        self.version = 0    # naik setiap perubahan struktur; bagian dari signature cache index
+
+    @property
+    def is_lazy(self) -> bool:
+        return self.estimator is not None
 
     def travel_time(self, u: str, v: str) -> float:
         if u == v:
             return 0.0
         key = (u, v)
-        if key not in self.travel_min:
+        w = self.travel_min.get(key)
+        if w is not None:
+            return float(w)
+        if self.estimator is None:
             raise KeyError(f"Missing travel time for edge {u}->{v}")
-        return float(self.travel_min[key])
+        w = self.estimated.get(key)
+        if w is None:
+            if u not in self.pois or v not in self.pois:
+                raise KeyError(f"Missing travel time for edge {u}->{v}")
+            w = self.estimator.estimate(u, v)
+            self.estimated[key] = w
+        return w
+
+    def invalidate_index(self) -> None:
+        self.version += 1
+        self._index = None
+
+    def set_edge(self, u: str, v: str, minutes: float) -> None:
+        self.travel_min[(u, v)] = minutes
+        self.estimated.pop((u, v), None)
+        self.invalidate_index()
+
+    def remove_edge(self, u: str, v: str) -> None:
+        del self.travel_min[(u, v)]
+        self.invalidate_index()
+
+    def fill_missing(self, ids: Optional[Iterable[str]] = None) -> int:
+        """
+        Bulk fill: estimasi semua edge yang belum diukur di antara `ids`
+        (default semua POI) sekaligus. Return jumlah edge yang diestimasi.
+        """
+        if self.estimator is None:
+            raise ValueError("fill_missing requires an estimator (lazy matrix mode)")
+        nodes = list(self.pois.keys()) if ids is None else list(ids)
+        measured, cached = self.travel_min, self.estimated
+        pairs = [
+            (u, v)
+            for u in nodes
+            for v in nodes
+            if u != v and (u, v) not in measured and (u, v) not in cached
+        ]
+        cached.update(zip(pairs, self.estimator.estimate_many(pairs)))
+        return len(pairs)
 
 def load_pois(path: str) -> Dict[str, POI]:
     pois: Dict[str, POI] = {}
@@ -0,0 +1,224 @@
+from array import array
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from .graph import Graph
+
+
+class GraphIndex:
+    """
+    Representasi CSR dari travel_min (edge terukur) + komponen strongly connected.
+    Dibangun sekali per graph (lihat get_index) lalu dipakai ulang oleh
+    validate_graph dan reachable_from.
+
+    ids[i]      : poi_id untuk index i
+    indptr      : out-neighbor node i ada di indices[indptr[i]:indptr[i+1]]
+    dangling    : edge di travel_min yang from/to-nya tidak ada di POI
+    comp[i]     : id SCC node i (dibangun hanya kalau DFS dari start tidak mencapai semua node)
+    """
+
+    def __init__(self, g: Graph):
+        self.ids: List[str] = list(g.pois.keys())
+        self.pos: Dict[str, int] = {pid: i for i, pid in enumerate(self.ids)}
+        self.dangling: List[Tuple[str, str]] = []
+        self._build_csr(g)
+        self._scc_built = False
+        self._reach: Dict[int, FrozenSet[int]] = {}
+
+    def _build_csr(self, g: Graph) -> None:
+        n = len(self.ids)
+        pos = self.pos
+        rows: List[List[int]] = [[] for _ in range(n)]
+        for (u, v) in g.travel_min.keys():
+            iu = pos.get(u)
+            iv = pos.get(v)
+            if iu is None or iv is None:
+                self.dangling.append((u, v))
+                continue
+            if iu != iv:
+                rows[iu].append(iv)
+
+        # key travel_min unik -> tidak ada duplikat per baris
+        self.indptr = array("l", [0]) * (n + 1)
+        self.indices = array("l")
+        for i, row in enumerate(rows):
+            self.indices.extend(row)
+            self.indptr[i + 1] = len(self.indices)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.ids)
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.indices)
+
+    def neighbors(self, i: int) -> array:
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def missing_edges(self, max_samples: int = 10) -> Tuple[int, List[Tuple[str, str]]]:
+        """
+        Jumlah pasangan (u != v) tanpa edge, dari degree tiap baris (tanpa scan N^2).
+        Sample dicari hanya di baris yang memang kurang edge, berhenti setelah max_samples.
+        """
+        n = self.n_nodes
+        total = n * (n - 1) - self.n_edges
+        samples: List[Tuple[str, str]] = []
+        if total == 0 or max_samples <= 0:
+            return total, samples
+
+        indptr, ids = self.indptr, self.ids
+        for i in range(n):
+            if indptr[i + 1] - indptr[i] == n - 1:
+                continue
+            have = set(self.neighbors(i))
+            for j in range(n):
+                if j != i and j not in have:
+                    samples.append((ids[i], ids[j]))
+                    if len(samples) >= max_samples:
+                        return total, samples
+        return total, samples
+
+    def _build_scc(self) -> None:
+        """
+        Tarjan iteratif (tanpa rekursi, aman untuk N besar).
+        Graph lengkap (kasus umum: full matrix) langsung 1 komponen tanpa scan edge.
+        """
+        self._scc_built = True
+        n = self.n_nodes
+        if n and self.n_edges == n * (n - 1):
+            self.comp = array("l", [0]) * n
+            self.n_components = 1
+            self.comp_adj = [set()]
+            self.comp_nodes = [list(range(n))]
+            return
+
+        indptr, indices = self.indptr, self.indices
+        index = array("l", [-1]) * n
+        low = array("l", [0]) * n
+        on_stack = bytearray(n)
+        comp = array("l", [-1]) * n
+        stack: List[int] = []
+        counter = 0
+        n_comp = 0
+
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            # frame: (node, posisi edge berikutnya)
+            work: List[List[int]] = [[root, indptr[root]]]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+
+            while work:
+                frame = work[-1]
+                v, e = frame
+                if e < indptr[v + 1]:
+                    frame[1] = e + 1
+                    w = indices[e]
+                    if index[w] == -1:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = 1
+                        work.append([w, indptr[w]])
+                    elif on_stack[w] and index[w] < low[v]:
+                        low[v] = index[w]
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[v] < low[parent]:
+                        low[parent] = low[v]
+                if low[v] == index[v]:
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        comp[w] = n_comp
+                        if w == v:
+                            break
+                    n_comp += 1
+
+        self.comp = comp
+        self.n_components = n_comp
+
+        # edge antar komponen (condensation DAG)
+        comp_adj: List[set] = [set() for _ in range(n_comp)]
+        for i in range(n):
+            ci = comp[i]
+            for j in indices[indptr[i]:indptr[i + 1]]:
+                cj = comp[j]
+                if cj != ci:
+                    comp_adj[ci].add(cj)
+        self.comp_adj = comp_adj
+        self.comp_nodes: List[List[int]] = [[] for _ in range(n_comp)]
+        for i in range(n):
+            self.comp_nodes[comp[i]].append(i)
+
+    def _reaches_all(self, start: int) -> bool:
+        """
+        DFS biasa di CSR dari start, berhenti begitu semua node tercapai. Untuk graph
+        padat ini selesai setelah beberapa baris saja (tanpa membangun SCC).
+        """
+        n = self.n_nodes
+        indptr, indices = self.indptr, self.indices
+        seen = bytearray(n)
+        seen[start] = 1
+        left = n - 1
+        todo = [start]
+        while todo and left:
+            v = todo.pop()
+            for w in indices[indptr[v]:indptr[v + 1]]:
+                if not seen[w]:
+                    seen[w] = 1
+                    left -= 1
+                    todo.append(w)
+        return left == 0
+
+    def reachable_components(self, c: int) -> FrozenSet[int]:
+        """
+        Komponen yang bisa dicapai dari komponen c (termasuk c), di-memo.
+        """
+        memo = self._reach
+        hit = memo.get(c)
+        if hit is not None:
+            return hit
+        seen = {c}
+        todo = [c]
+        while todo:
+            x = todo.pop()
+            for y in self.comp_adj[x]:
+                if y not in seen:
+                    seen.add(y)
+                    todo.append(y)
+        out = frozenset(seen)
+        memo[c] = out
+        return out
+
+    def reachable_ids(self, start_id: str) -> List[str]:
+        # hanya node POI; target edge dangling (tidak ada di pois) tidak ikut
+        if not self._scc_built:
+            # kasus umum: semua node tercapai -> SCC tidak perlu dibangun
+            if self._reaches_all(self.pos[start_id]):
+                return list(self.ids)
+            self._build_scc()
+        comps = self.reachable_components(self.comp[self.pos[start_id]])
+        ids = self.ids
+        return [ids[i] for c in comps for i in self.comp_nodes[c]]
+
+
+def get_index(g: Graph) -> GraphIndex:
+    """
+    Index di-cache di graph. Signature: identitas + ukuran dict pois/travel_min dan
+    g.version, jadi dict yang diganti, tambah/hapus edge, dan set_edge/remove_edge
+    (atau invalidate_index() setelah mutasi langsung) memicu rebuild.
+    """
+    sig = (id(g.pois), id(g.travel_min), len(g.pois), len(g.travel_min), getattr(g, "version", 0))
+    cached: Optional[Tuple[Tuple[int, ...], GraphIndex]] = getattr(g, "_index", None)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    idx = GraphIndex(g)
+    g._index = (sig, idx)
+    return idx
@@ -1,9 +1,11 @@
+from array import array
 from dataclasses import dataclass
-from typing import List, Dict, Tuple, Optional
+from typing import List, Optional
 from .graph import Graph
 
 @dataclass
 class StopSchedule:
+    __slots__ = ("poi_id", "arrive", "wait", "start_service", "depart", "late")
     poi_id: str
     arrive: int
     wait: int
@@ -11,32 +13,95 @@ class StopSchedule:
     depart: int
     late: int  # menit terlambat melewati close time
 
-@dataclass
 class EvalResult:
-    total_travel: int
-    total_wait: int
-    total_late: int
-    total_service: int
-    total_cost: float
-    schedule: List[StopSchedule]
+    """
+    Hasil evaluate_route. Schedule disimpan sebagai array paralel (arrive/wait/start/depart/late,
+    typecode "l", atau "d" kalau start_time_min bukan int); list StopSchedule baru dibuat saat .schedule diakses pertama kali.
+    Kalau evaluate_route dipanggil dengan keep_schedule=False, hanya total yang tersedia.
+    """
+    __slots__ = (
+        "total_travel", "total_wait", "total_late", "total_service", "total_cost",
+        "route", "arrive", "wait", "start_service", "depart", "late", "_schedule",
+    )
+
+    def __init__(
+        self,
+        total_travel: int,
+        total_wait: int,
+        total_late: int,
+        total_service: int,
+        total_cost: float,
+        route: Optional[List[str]] = None,
+        arrive: Optional[array] = None,
+        wait: Optional[array] = None,
+        start_service: Optional[array] = None,
+        depart: Optional[array] = None,
+        late: Optional[array] = None,
+    ):
+        self.total_travel = total_travel
+        self.total_wait = total_wait
+        self.total_late = total_late
+        self.total_service = total_service
+        self.total_cost = total_cost
+        self.route = route
+        self.arrive = arrive
+        self.wait = wait
+        self.start_service = start_service
+        self.depart = depart
+        self.late = late
+        self._schedule: Optional[List[StopSchedule]] = None
+
+    @property
+    def has_schedule(self) -> bool:
+        return self.route is not None
+
+    def stop(self, i: int) -> StopSchedule:
+        if self.route is None:
+            raise ValueError("EvalResult was created without schedule (keep_schedule=False)")
+        return StopSchedule(
+            poi_id=self.route[i],
+            arrive=self.arrive[i],
+            wait=self.wait[i],
+            start_service=self.start_service[i],
+            depart=self.depart[i],
+            late=self.late[i],
+        )
+
+    @property
+    def schedule(self) -> List[StopSchedule]:
+        if self._schedule is None:
+            if self.route is None:
+                raise ValueError("EvalResult was created without schedule (keep_schedule=False)")
+            self._schedule = [self.stop(i) for i in range(len(self.route))]
+        return self._schedule
+
+    def __repr__(self) -> str:
+        return (
+            f"EvalResult(total_travel={self.total_travel}, total_wait={self.total_wait}, "
+            f"total_late={self.total_late}, total_service={self.total_service}, "
+            f"total_cost={self.total_cost}, stops={len(self.route) if self.route is not None else None})"
+        )
 
 def evaluate_route(
     g: Graph,
     route: List[str],
     start_time_min: int,
     late_penalty: float = 10.0,
+    keep_schedule: bool = True,
 ) -> EvalResult:
     """
     route: urutan POI yang akan dikunjungi (mis. ["A","C","B","J"])
     start_time_min: waktu mulai dalam menit (mis. 480 = 08:00)
     late_penalty: bobot penalti keterlambatan (semakin besar -> makin anti telat)
+    keep_schedule: False -> hanya total (tanpa array per stop), untuk evaluasi massal di GA
     """
     if len(route) < 1:
         raise ValueError("Route must contain at least 1 node")
 
     # basic sanity
+    pois = g.pois
     for pid in route:
-        if pid not in g.pois:
+        if pid not in pois:
             raise KeyError(f"POI not found in route: {pid}")
 
     t = start_time_min
@@ -44,17 +109,27 @@ def evaluate_route(
     total_wait = 0
     total_late = 0
     total_service = 0
-    schedule: List[StopSchedule] = []
 
-    for i, pid in enumerate(route):
-        poi = g.pois[pid]
+    if keep_schedule:
+        # start time pecahan (mis. 480.5) tetap diterima seperti sebelumnya -> array double
+        tc = "l" if isinstance(start_time_min, int) else "d"
+        a_arrive = array(tc)
+        a_wait = array(tc)
+        a_start = array(tc)
+        a_depart = array(tc)
+        a_late = array(tc)
+
+    travel_time = g.travel_time
+    prev = None
+    for pid in route:
+        poi = pois[pid]
 
         # travel from previous
-        if i > 0:
-            prev = route[i - 1]
-            travel = int(round(g.travel_time(prev, pid)))
+        if prev is not None:
+            travel = int(round(travel_time(prev, pid)))
             t += travel
             total_travel += travel
+        prev = pid
 
         arrive = t
 
@@ -77,32 +152,34 @@ def evaluate_route(
         t += poi.service_min
         total_service += poi.service_min
 
-        depart = t
-
-        schedule.append(
-            StopSchedule(
-                poi_id=pid,
-                arrive=arrive,
-                wait=wait,
-                start_service=start_service,
-                depart=depart,
-                late=late,
-            )
-        )
+        if keep_schedule:
+            a_arrive.append(arrive)
+            a_wait.append(wait)
+            a_start.append(start_service)
+            a_depart.append(t)
+            a_late.append(late)
 
     # cost: travel + wait + penalty*late
     total_cost = float(total_travel + total_wait + late_penalty * total_late)
 
+    if not keep_schedule:
+        return EvalResult(total_travel, total_wait, total_late, total_service, total_cost)
     return EvalResult(
         total_travel=total_travel,
         total_wait=total_wait,
         total_late=total_late,
         total_service=total_service,
         total_cost=total_cost,
-        schedule=schedule,
+        route=list(route),
+        arrive=a_arrive,
+        wait=a_wait,
+        start_service=a_start,
+        depart=a_depart,
+        late=a_late,
     )
 
 def fmt_time(m: int) -> str:
+    m = int(m)  # start time pecahan -> schedule float
     hh = m // 60
     mm = m % 60
     return f"{hh:02d}:{mm:02d}"
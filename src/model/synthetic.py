@@ -0,0 +1,155 @@
+from dataclasses import dataclass, replace
+from typing import Dict, List, Tuple
+import random
+
+from .graph import Graph, POI
+from .geo import GeoEstimator, SpeedModel
+
+# titik tengah koordinat diambil dari data/processed/poi.csv (Jakarta)
+CENTER_LAT = -6.2000
+CENTER_LON = 106.8166
+
+
+@dataclass
+class SyntheticConfig:
+    n_pois: int = 50                 # total POI termasuk start + end
+    coords: str = "uniform"          # "uniform" | "clustered"
+    windows: str = "loose"           # "loose" | "tight"
+    spread_deg: float = 0.08         # lebar area (derajat) di sekitar CENTER
+    n_clusters: int = 5              # hanya untuk coords="clustered"
+    cluster_sigma_deg: float = 0.008
+    speed_kmh: float = 25.0          # kecepatan rata-rata kota
+    detour: float = 1.3              # faktor jalan vs garis lurus
+    day_start_min: int = 480         # 08:00
+    day_end_min: int = 1320          # 22:00 (horizon minimum, lihat generate_instance)
+    lazy: bool = False               # True: tanpa matriks, travel time diestimasi on demand
+    seed: int = 0
+
+
+@dataclass
+class SyntheticInstance:
+    name: str
+    graph: Graph
+    start_id: str
+    end_id: str
+    visit_ids: List[str]
+    start_time_min: int
+
+
+def _gen_coords(rng: random.Random, cfg: SyntheticConfig, n: int) -> List[Tuple[float, float]]:
+    half = cfg.spread_deg / 2
+    if cfg.coords == "uniform":
+        return [
+            (CENTER_LAT + rng.uniform(-half, half), CENTER_LON + rng.uniform(-half, half))
+            for _ in range(n)
+        ]
+    if cfg.coords == "clustered":
+        centers = [
+            (CENTER_LAT + rng.uniform(-half, half), CENTER_LON + rng.uniform(-half, half))
+            for _ in range(max(1, cfg.n_clusters))
+        ]
+        out = []
+        for _ in range(n):
+            clat, clon = rng.choice(centers)
+            out.append((rng.gauss(clat, cfg.cluster_sigma_deg), rng.gauss(clon, cfg.cluster_sigma_deg)))
+        return out
+    raise ValueError(f"Unknown coords mode: {cfg.coords}")
+
+
+def _reference_arrivals(
+    est: GeoEstimator, ids: List[str], services: List[int], day0: int
+) -> Tuple[List[int], int]:
+    """
+    Jadwal tur referensi start -> visit (urutan id) -> end tanpa menunggu.
+    Return (arrival tiap POI, waktu tiba di end). Dipakai untuk menskalakan horizon
+    dan menaruh window "tight" supaya instance feasible by construction.
+    """
+    legs = est.estimate_many(zip(ids, ids[1:]))
+    arrivals = [day0]
+    t = float(day0)
+    for i, leg in enumerate(legs, start=1):
+        t += services[i - 1] + leg
+        arrivals.append(int(t))
+    return arrivals, arrivals[-1]
+
+
+def _gen_window(
+    rng: random.Random, cfg: SyntheticConfig, day0: int, day1: int, arrival: int
+) -> Tuple[int, int]:
+    if cfg.windows == "loose":
+        # open <= arrival dan close >= arrival: tur referensi tidak menunggu / telat
+        open_min = rng.randrange(day0, day0 + 121, 30)
+        close_min = rng.randrange(day1 - 240, day1 + 1, 30)
+        return min(open_min, arrival), max(close_min, arrival)
+    if cfg.windows == "tight":
+        # window 60-180 menit yang memuat arrival tur referensi
+        width = rng.randrange(60, 181, 15)
+        open_min = max(day0, arrival - rng.randrange(0, width + 1, 15))
+        return open_min, max(open_min + width, arrival)
+    raise ValueError(f"Unknown windows mode: {cfg.windows}")
+
+
+def generate_instance(cfg: SyntheticConfig) -> SyntheticInstance:
+    """
+    Instance sintetis yang deterministik untuk seed yang sama.
+    POI pertama = start, POI terakhir = end (lokasi sama, service 0, window sepanjang horizon),
+    sisanya jadi visit_ids. Matriks waktu: haversine * detour / speed (full N^2),
+    atau kosong + GeoEstimator kalau cfg.lazy.
+
+    Horizon = max(day_end_min, selesai tur referensi), jadi ikut membesar dengan n_pois:
+    tanpa ini instance > ~25 POI mustahil feasible (service 15-60 menit per POI dalam
+    08:00-22:00) dan cost hampir seluruhnya late penalty.
+    """
+    if cfg.n_pois < 3:
+        raise ValueError("n_pois must be >= 3 (start, end, and at least 1 visit)")
+
+    rng = random.Random(cfg.seed)
+    n = cfg.n_pois
+    day0 = cfg.day_start_min
+    width = len(str(n - 1))
+    ids = [f"P{i:0{width}d}" for i in range(n)]
+
+    coords = _gen_coords(rng, cfg, n - 1)
+    coords.append(coords[0])  # end di lokasi yang sama dengan start
+    services = [0] + [rng.randrange(15, 61, 5) for _ in range(n - 2)] + [0]
+
+    # window diisi setelah tur referensi dihitung (estimator hanya butuh lat/lon)
+    pois: Dict[str, POI] = {
+        pid: POI(
+            poi_id=pid,
+            name="Start" if i == 0 else ("End" if i == n - 1 else f"POI{i}"),
+            lat=coords[i][0],
+            lon=coords[i][1],
+            open_min=day0,
+            close_min=day0,
+            service_min=services[i],
+        )
+        for i, pid in enumerate(ids)
+    }
+    est = GeoEstimator(pois, SpeedModel(speed_kmh=cfg.speed_kmh, detour=cfg.detour))
+    arrivals, finish = _reference_arrivals(est, ids, services, day0)
+    day1 = max(cfg.day_end_min, finish)
+
+    for i, pid in enumerate(ids):
+        if i == 0 or i == n - 1:
+            open_min, close_min = day0, day1
+        else:
+            open_min, close_min = _gen_window(rng, cfg, day0, day1, arrivals[i])
+        pois[pid] = replace(pois[pid], open_min=open_min, close_min=close_min)
+
+    travel: Dict[Tuple[str, str], float] = {}
+    if not cfg.lazy:
+        pairs = [(u, v) for u in ids for v in ids if u != v]
+        travel = dict(zip(pairs, est.estimate_many(pairs)))
+
+    name = f"n{n}_{cfg.coords}_{cfg.windows}_s{cfg.seed}"
+    if cfg.lazy:
+        name += "_lazy"
+    return SyntheticInstance(
+        name=name,
+        graph=Graph(pois, travel, estimator=est if cfg.lazy else None),
+        start_id=ids[0],
+        end_id=ids[-1],
+        visit_ids=ids[1:-1],
+        start_time_min=cfg.day_start_min,
+    )
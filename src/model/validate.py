@@ -1,31 +1,29 @@
-from typing import List, Tuple, Set
+from typing import List, Set
 from .graph import Graph
-from collections import deque
+from .graph_index import get_index
 
-def validate_graph(g: Graph) -> List[str]:
+def validate_graph(g: Graph, max_samples: int = 10) -> List[str]:
     errors: List[str] = []
-    poi_ids = set(g.pois.keys())
+    idx = get_index(g)  # CSR + SCC, di-cache di graph
 
     # 1) Cek: semua edge mengarah ke POI yang ada
-    for (u, v) in g.travel_min.keys():
-        if u not in poi_ids:
+    for (u, v) in idx.dangling:
+        if u not in idx.pos:
             errors.append(f"Edge from_id not found in POI: {u}")
-        if v not in poi_ids:
+        if v not in idx.pos:
             errors.append(f"Edge to_id not found in POI: {v}")
 
     # 2) Cek: missing edges (untuk kasus fully-connected seperti dummy M1)
-    missing: List[Tuple[str, str]] = []
-    for u in poi_ids:
-        for v in poi_ids:
-            if u == v:
-                continue
-            if (u, v) not in g.travel_min:
-                missing.append((u, v))
-
-    if missing:
+    # lazy matrix mode: edge yang hilang diestimasi dari lat/lon, bukan error
+    if g.is_lazy:
+        return errors
+
+    # jumlah dari degree CSR; sample dicari sekali jalan dan berhenti di max_samples
+    n_missing, missing = idx.missing_edges(max_samples)
+    if n_missing:
         # tampilkan sebagian agar tidak spam
-        sample = ", ".join([f"{u}->{v}" for (u, v) in missing[:10]])
-        errors.append(f"Missing edges: {len(missing)} (sample: {sample})")
+        sample = ", ".join([f"{u}->{v}" for (u, v) in missing])
+        errors.append(f"Missing edges: {n_missing} (sample: {sample})")
 
     return errors
 
@@ -33,19 +31,9 @@ def reachable_from(g: Graph, start_id: str) -> Set[str]:
     if start_id not in g.pois:
         raise KeyError(f"Start POI not found: {start_id}")
 
-    # build adjacency from travel_min keys
-    adj = {pid: [] for pid in g.pois.keys()}
-    for (u, v) in g.travel_min.keys():
-        if u in adj:
-            adj[u].append(v)
-
-    seen = set([start_id])
-    q = deque([start_id])
-
-    while q:
-        u = q.popleft()
-        for v in adj.get(u, []):
-            if v not in seen:
-                seen.add(v)
-                q.append(v)
-    return seen
\ No newline at end of file
+    # lazy matrix mode: semua pasangan punya travel time (terukur atau estimasi)
+    if g.is_lazy:
+        return set(g.pois.keys())
+
+    # SCC dihitung sekali per graph; reachability = gabungan komponen yang bisa dicapai
+    return set(get_index(g).reachable_ids(start_id))